@@ -37,25 +37,86 @@ The Bluetooth FTMS specification is from the Bluetooth SIG:
     https://www.bluetooth.com/specifications/specs/fitness-machine-service-1-0/
 """
 
+import array
+import micropython
 import ubluetooth
-from micropython import const
+from machine import Timer
+from micropython import const, schedule
 import struct
 import utime
 
+# Set to 1 to log BLE events (connections, control point, pairing).
+# Logging is compiled out entirely when 0.
+_DEBUG = const(0)
+
+# Module-level aliases for hot-path time functions (skip attribute lookup)
+_ticks_ms = utime.ticks_ms
+_ticks_diff = utime.ticks_diff
+
+
+@micropython.viper
+def _ms_to_1024(t: int) -> int:
+    """Convert milliseconds to 1/1024 second units without a divide.
+
+    Uses t * (1 + 1/64 + 1/128) = t * 1.0234 (within 0.06% of t * 1.024).
+    The RP2040's Cortex-M0+ has no hardware divider; viper compiles the
+    shifts and adds to native machine-word instructions.
+
+    Args:
+        t: Time in milliseconds (non-negative).
+
+    Returns:
+        Time in 1/1024 second units.
+    """
+    return t + (t >> 6) + (t >> 7)
+
+
+@micropython.viper
+def _uint16_at(value, offset: int) -> int:
+    """Read a little-endian uint16 from a buffer without allocating.
+
+    Args:
+        value: Buffer (bytes/bytearray/memoryview).
+        offset: Byte offset of the low byte.
+
+    Returns:
+        Unsigned 16-bit integer.
+    """
+    buf = ptr8(value)
+    return buf[offset] | (buf[offset + 1] << 8)
+
+
+@micropython.viper
+def _sint16_at(value, offset: int) -> int:
+    """Read a little-endian sint16 from a buffer without allocating.
+
+    Args:
+        value: Buffer (bytes/bytearray/memoryview).
+        offset: Byte offset of the low byte.
+
+    Returns:
+        Signed 16-bit integer.
+    """
+    buf = ptr8(value)
+    raw = buf[offset] | (buf[offset + 1] << 8)
+    if raw & 0x8000:
+        raw -= 0x10000
+    return raw
+
 
 # ============================================================================
 # BLE Service UUIDs (Standard Bluetooth SIG)
 # ============================================================================
 
 # Fitness Machine Service (FTMS) - Primary service for smart trainers
-_FTMS_UUID = ubluetooth.UUID(0x1826)
+_FTMS_UUID16 = const(0x1826)
+_FTMS_UUID = ubluetooth.UUID(_FTMS_UUID16)
 _FTMS_FEATURE_UUID = ubluetooth.UUID(0x2ACC)           # Feature characteristic
 _FTMS_INDOOR_BIKE_DATA_UUID = ubluetooth.UUID(0x2AD2)  # Indoor bike data
 _FTMS_CONTROL_POINT_UUID = ubluetooth.UUID(0x2AD9)     # Control point
 _FTMS_STATUS_UUID = ubluetooth.UUID(0x2ADA)            # Machine status
 _FTMS_TRAINING_STATUS_UUID = ubluetooth.UUID(0x2AD3)   # Training status
 _FTMS_RESISTANCE_RANGE_UUID = ubluetooth.UUID(0x2AD6)  # Resistance level range
-_FTMS_POWER_RANGE_UUID = ubluetooth.UUID(0x2AD8)       # Power range
 _FTMS_INCLINATION_RANGE_UUID = ubluetooth.UUID(0x2AD5) # Inclination range
 
 # Cycling Speed and Cadence Service (CSCS) - For basic speed/cadence
@@ -168,6 +229,37 @@ _STATUS_INDOOR_BIKE_SIM_CHANGED = const(0x12)
 _ADV_TYPE_FLAGS = const(0x01)
 _ADV_TYPE_NAME = const(0x09)
 _ADV_TYPE_UUID16_COMPLETE = const(0x03)
+_ADV_INTERVAL_NORMAL_US = const(200000)
+_ADV_INTERVAL_PAIRING_US = const(100000)
+
+# ============================================================================
+# Notification payload layouts (packed into preallocated buffers)
+# ============================================================================
+# MicroPython's struct has no Struct class; module-level format strings are
+# interned once and passed straight to pack_into on the hot paths.
+_IBD_FORMAT = "<HHHhh"    # Flags, speed, cadence, resistance, power (10 bytes)
+_IBD_SIZE = const(10)
+# Instantaneous speed (bit 0 clear), cadence, resistance level and power present
+_IBD_FLAGS = const(_IBD_INST_CADENCE | _IBD_RESISTANCE_LEVEL | _IBD_INST_POWER)
+_CSC_FORMAT = "<BIHHH"    # Flags, wheel revs, wheel time, crank revs, crank time (11 bytes)
+_CSC_SIZE = const(11)
+_CSC_FLAGS = const(0x03)  # Wheel and crank revolution data present
+_STATUS_MAX_SIZE = const(7)  # Status op code + up to 6 parameter bytes (bike sim)
+_DATA_FRAME_MAX = const(11)  # Largest timer-driven frame (CSC), checked against the MTU
+_STOP_PARAM_DEFAULT = b"\x01"  # Stop/Pause control information: stop
+
+# ============================================================================
+# Characteristic handle indices (registration order in _register_services)
+# ============================================================================
+_H_FTMS_FEATURE = const(0)
+_H_FTMS_INDOOR_BIKE_DATA = const(1)
+_H_FTMS_CONTROL_POINT = const(2)
+_H_FTMS_STATUS = const(3)
+_H_FTMS_TRAINING_STATUS = const(4)
+_H_FTMS_RESISTANCE_RANGE = const(5)
+_H_FTMS_INCLINATION_RANGE = const(6)
+_H_CSCS_MEASUREMENT = const(7)
+_H_CSCS_FEATURE = const(8)
 
 # ============================================================================
 # BLE IRQ Events
@@ -175,6 +267,29 @@ _ADV_TYPE_UUID16_COMPLETE = const(0x03)
 _IRQ_CENTRAL_CONNECT = const(1)
 _IRQ_CENTRAL_DISCONNECT = const(2)
 _IRQ_GATTS_WRITE = const(3)
+_IRQ_GATTS_INDICATE_DONE = const(20)
+_IRQ_MTU_EXCHANGED = const(21)
+
+# ============================================================================
+# ATT MTU
+# ============================================================================
+_ATT_MTU_DEFAULT = const(23)
+_ATT_MTU_PREFERRED = const(247)
+_ATT_HEADER_SIZE = const(3)   # Opcode + attribute handle
+
+# ============================================================================
+# Notification pacing
+# ============================================================================
+_MIN_NOTIFY_MS = const(20)         # Minimum gap between data notification bursts
+_INDICATE_TIMEOUT_MS = const(50)   # Give up waiting for an indicate ack after this
+_CSC_NOTIFY_PERIOD_MS = const(250)  # Notify timer period (CSC sent every tick)
+_IBD_NOTIFY_EVERY = const(4)       # Indoor Bike Data every Nth tick (1 s)
+_IBD_REFRESH_EVERY = const(2)      # Unchanged Indoor Bike Data re-sent every Nth frame (2 s)
+_PAIRING_RETRY_MS = const(50)      # Re-arm delay if the pairing timeout can't be scheduled
+
+# Incline changes smaller than this (in %) are not passed to the load
+# controller. Zwift sends sim updates ~4 Hz with tiny grade deltas.
+_INCLINE_DEADBAND = 0.05
 
 # ============================================================================
 # BLE Characteristic Flags
@@ -184,6 +299,27 @@ _FLAG_WRITE = const(0x0008)
 _FLAG_NOTIFY = const(0x0010)
 _FLAG_INDICATE = const(0x0020)
 
+# ============================================================================
+# GATT Service Definitions (order must match the _H_* handle indices)
+# ============================================================================
+_FTMS_CHARS = (
+    (_FTMS_FEATURE_UUID, _FLAG_READ),
+    (_FTMS_INDOOR_BIKE_DATA_UUID, _FLAG_NOTIFY),
+    (_FTMS_CONTROL_POINT_UUID, _FLAG_WRITE | _FLAG_INDICATE),
+    (_FTMS_STATUS_UUID, _FLAG_NOTIFY),
+    (_FTMS_TRAINING_STATUS_UUID, _FLAG_READ | _FLAG_NOTIFY),
+    (_FTMS_RESISTANCE_RANGE_UUID, _FLAG_READ),
+    (_FTMS_INCLINATION_RANGE_UUID, _FLAG_READ),
+)
+_CSCS_CHARS = (
+    (_CSCS_MEASUREMENT_UUID, _FLAG_NOTIFY),
+    (_CSCS_FEATURE_UUID, _FLAG_READ),
+)
+_SERVICE_DEFS = (
+    (_FTMS_UUID, _FTMS_CHARS),
+    (_CSCS_UUID, _CSCS_CHARS),
+)
+
 
 class BLEController:
     """BLE Controller implementing FTMS for smart bike trainer compatibility.
@@ -210,18 +346,57 @@ class BLEController:
         self.ble.active(True)
         print(f"BLE: Activated (active={self.ble.active()})")
 
+        # Bind hot-path BLE methods once (skips two attribute lookups per call)
+        self._gatts_notify = self.ble.gatts_notify
+        self._gatts_write = self.ble.gatts_write
+        self._gatts_indicate = self.ble.gatts_indicate
+        self._gatts_read = self.ble.gatts_read
+        # gatts_indicate(data=...) needs MicroPython 1.20+; cleared on first TypeError
+        self._indicate_with_data = True
+
+        # Ask for a larger ATT MTU so longer frames fit in one notification
+        try:
+            self.ble.config(mtu=_ATT_MTU_PREFERRED)
+        except Exception as e:
+            print(f"BLE: Could not set MTU: {e}")
+
         self.connected = False
         self.conn_handle = None
         self.control_granted = False
-
-        # Cumulative counters for CSC
-        self.wheel_revolutions = 0
-        self.crank_revolutions = 0
-        self.last_wheel_event_time = 0
-        self.last_crank_event_time = 0
-        self.last_wheel_rpm = 0
-        self.last_crank_rpm = 0
-        self.last_update_time = 0
+        self._peer_mtu = {}  # Negotiated ATT MTU per connection handle
+
+        # Cumulative counters for CSC, held in typed arrays: stores wrap to
+        # uint32/uint16 in C, so the values never grow into boxed long ints
+        self._wheel_revs = array.array('I', (0,))
+        self._crank_revs = array.array('H', (0,))
+        self._csc_event_times = array.array('H', (0, 0))  # Wheel, crank (1/1024 s)
+
+        # Preallocated notification buffers (avoid per-notify allocation).
+        # These are never rebound - the BLE stack copies from them on write.
+        self._ibd_buf = bytearray(_IBD_SIZE)
+        self._csc_buf = bytearray(_CSC_SIZE)
+        self._cp_response_buf = bytearray(3)      # Response code, op code, result
+        self._training_status_buf = bytearray(2)  # Flags, status
+        self._status_buf = bytearray(_STATUS_MAX_SIZE)
+        # One view per frame length, so notifying a prefix doesn't allocate
+        status_mv = memoryview(self._status_buf)
+        self._status_views = tuple(status_mv[:n] for n in range(_STATUS_MAX_SIZE + 1))
+
+        # Last CSC frame sent - identical frames (no new pulses) are skipped
+        self._last_csc = bytearray(_CSC_SIZE)
+        self._last_csc_valid = False
+
+        # Last Indoor Bike Data frame sent - unchanged frames are only
+        # re-sent every _IBD_REFRESH_EVERY frames as a keep-alive. Counted in
+        # frames, not ms, so the refresh can't land on the send period itself
+        self._last_ibd = bytearray(_IBD_SIZE)
+        self._ibd_unchanged = 0  # Unchanged frames skipped since the last send
+        self._last_ibd_valid = False
+
+        # Notification pacing (don't queue faster than the link drains)
+        self._last_notify_time = 0
+        self._indicate_in_flight = False
+        self._indicate_sent_at = 0
 
         # Target values from control point
         self.target_incline = 0.0      # -20.0 to +20.0 %
@@ -232,13 +407,36 @@ class BLEController:
         self.sim_crr = 0               # Coefficient * 10000
         self.sim_cw = 0                # kg/m * 100
 
+        # Incline writes are applied outside the BLE IRQ via micropython.schedule.
+        # Only the latest value is kept so bursts can't overflow the schedule queue.
+        self._pending_incline = 0.0
+        self._incline_scheduled = False
+        self._apply_pending_incline_cb = self._apply_pending_incline  # Bind once
+
         # Pairing mode
         self.pairing_mode = False
         self.pairing_mode_start_time = 0
         self.pairing_mode_duration_ms = 120000
+        self._pairing_deadline = 0  # ticks_ms when pairing mode expires
         self.normal_name = self.name
         self.pairing_name = self.name[:11] + " PAIR"
 
+        # Periodic timer drives notifications while a central is connected,
+        # so their cadence doesn't depend on the application's main loop
+        self._notify_timer = Timer()
+        self._notify_tick_count = 0
+        self._on_notify_timer_cb = self._on_notify_timer  # Bind once (used in IRQ)
+        self._notify_tick_cb = self._notify_tick
+
+        # One-shot timer ends pairing mode, so the main loop needn't poll it
+        self._pairing_timer = Timer()
+        self._on_pairing_timer_cb = self._on_pairing_timer  # Bind once (used in IRQ)
+        self._pairing_timeout_cb = self._pairing_timeout
+
+        # Advertising payloads are static per name - build them once
+        self._adv_normal = self._build_adv_data(self.normal_name)
+        self._adv_pairing = self._build_adv_data(self.pairing_name)
+
         # Register IRQ handler
         self.ble.irq(self._irq_handler)
 
@@ -248,79 +446,104 @@ class BLEController:
         # Start advertising
         self._advertise()
 
-        print(f"BLE: Initialized as '{self.name}'")
-
     def _irq_handler(self, event, data):
-        """Handle BLE IRQ events."""
-        if event == _IRQ_CENTRAL_CONNECT:
-            conn_handle, addr_type, addr = data
-            self.connected = True
-            self.conn_handle = conn_handle
+        """Handle BLE IRQ events.
+
+        Dispatches through the _IRQ_HANDLERS table; unhandled events are ignored.
+        """
+        handler = self._IRQ_HANDLERS.get(event)
+        if handler is not None:
+            handler(self, data)
+
+    def _on_central_connect(self, data):
+        """Handle a central connecting."""
+        conn_handle, addr_type, addr = data
+        self.connected = True
+        self.conn_handle = conn_handle
+        self._last_csc_valid = False  # New peer must get a full first frame
+        self._last_ibd_valid = False
+        if _DEBUG:
             print(f"BLE: Connected (handle={conn_handle})")
-            if self.pairing_mode:
-                self.stop_pairing_mode()
-
-        elif event == _IRQ_CENTRAL_DISCONNECT:
-            conn_handle, addr_type, addr = data
-            self.connected = False
-            self.conn_handle = None
-            self.control_granted = False
+        if self.pairing_mode:
+            self.stop_pairing_mode()
+        try:
+            self.ble.gattc_exchange_mtu(conn_handle)
+        except Exception:
+            pass  # Central may initiate the exchange instead
+        self._notify_tick_count = 0
+        self._notify_timer.init(mode=Timer.PERIODIC, period=_CSC_NOTIFY_PERIOD_MS,
+                                callback=self._on_notify_timer_cb)
+
+    def _on_central_disconnect(self, data):
+        """Handle a central disconnecting and resume advertising."""
+        conn_handle, addr_type, addr = data
+        self._notify_timer.deinit()
+        self.connected = False
+        self.conn_handle = None
+        self.control_granted = False
+        self._indicate_in_flight = False
+        self._peer_mtu.pop(conn_handle, None)
+        if _DEBUG:
             print("BLE: Disconnected")
-            self._advertise()
+        self._advertise()
 
-        elif event == _IRQ_GATTS_WRITE:
-            conn_handle, value_handle = data
-            value = self.ble.gatts_read(value_handle)
-            if value_handle == self.ftms_control_point_handle:
-                self._handle_control_point(value)
+    def _on_gatts_write(self, data):
+        """Handle a characteristic write from the central."""
+        conn_handle, value_handle = data
+        # Only the control point is writable - don't read anything else
+        if value_handle == self.ftms_control_point_handle:
+            self._handle_control_point(self._gatts_read(value_handle))
+
+    def _on_indicate_done(self, data):
+        """Handle the central acknowledging an indication."""
+        self._indicate_in_flight = False
+
+    def _on_mtu_exchanged(self, data):
+        """Record the negotiated ATT MTU for a connection."""
+        conn_handle, mtu = data
+        self._peer_mtu[conn_handle] = mtu
+        if _DEBUG:
+            print(f"BLE: MTU exchanged (handle={conn_handle}, mtu={mtu})")
+
+    # IRQ event -> handler dispatch table (unbound functions, called with self)
+    _IRQ_HANDLERS = {
+        _IRQ_CENTRAL_CONNECT: _on_central_connect,
+        _IRQ_CENTRAL_DISCONNECT: _on_central_disconnect,
+        _IRQ_GATTS_WRITE: _on_gatts_write,
+        _IRQ_GATTS_INDICATE_DONE: _on_indicate_done,
+        _IRQ_MTU_EXCHANGED: _on_mtu_exchanged,
+    }
+
+    def _max_payload(self, conn_handle):
+        """Get the largest notification payload for a connection.
+
+        Args:
+            conn_handle: BLE connection handle.
+
+        Returns:
+            Maximum attribute value length in bytes (ATT MTU minus header).
+        """
+        return self._peer_mtu.get(conn_handle, _ATT_MTU_DEFAULT) - _ATT_HEADER_SIZE
 
     def _register_services(self):
         """Register FTMS and CSCS services."""
-        
-        # FTMS characteristics
-        ftms_feature = (_FTMS_FEATURE_UUID, _FLAG_READ)
-        ftms_indoor_bike_data = (_FTMS_INDOOR_BIKE_DATA_UUID, _FLAG_NOTIFY)
-        ftms_control_point = (_FTMS_CONTROL_POINT_UUID, _FLAG_WRITE | _FLAG_INDICATE)
-        ftms_status = (_FTMS_STATUS_UUID, _FLAG_NOTIFY)
-        ftms_training_status = (_FTMS_TRAINING_STATUS_UUID, _FLAG_READ | _FLAG_NOTIFY)
-        ftms_resistance_range = (_FTMS_RESISTANCE_RANGE_UUID, _FLAG_READ)
-        ftms_inclination_range = (_FTMS_INCLINATION_RANGE_UUID, _FLAG_READ)
-
-        # CSCS characteristics
-        cscs_measurement = (_CSCS_MEASUREMENT_UUID, _FLAG_NOTIFY)
-        cscs_feature = (_CSCS_FEATURE_UUID, _FLAG_READ)
+        services = self.ble.gatts_register_services(_SERVICE_DEFS)
 
-        # Register services
-        services = self.ble.gatts_register_services((
-            (_FTMS_UUID, (
-                ftms_feature,
-                ftms_indoor_bike_data,
-                ftms_control_point,
-                ftms_status,
-                ftms_training_status,
-                ftms_resistance_range,
-                ftms_inclination_range,
-            )),
-            (_CSCS_UUID, (
-                cscs_measurement,
-                cscs_feature,
-            )),
-        ))
-
-        # Unpack handles
-        ftms_handles = services[0]
-        cscs_handles = services[1]
-
-        self.ftms_feature_handle = ftms_handles[0]
-        self.ftms_indoor_bike_data_handle = ftms_handles[1]
-        self.ftms_control_point_handle = ftms_handles[2]
-        self.ftms_status_handle = ftms_handles[3]
-        self.ftms_training_status_handle = ftms_handles[4]
-        self.ftms_resistance_range_handle = ftms_handles[5]
-        self.ftms_inclination_range_handle = ftms_handles[6]
-
-        self.cscs_measurement_handle = cscs_handles[0]
-        self.cscs_feature_handle = cscs_handles[1]
+        # Flatten handles (FTMS then CSCS) into one uint16 array
+        # (array.extend() only takes buffer objects, so build from a tuple)
+        handles = array.array('H', services[0] + services[1])
+        self._handles = handles
+
+        self.ftms_feature_handle = handles[_H_FTMS_FEATURE]
+        self.ftms_indoor_bike_data_handle = handles[_H_FTMS_INDOOR_BIKE_DATA]
+        self.ftms_control_point_handle = handles[_H_FTMS_CONTROL_POINT]
+        self.ftms_status_handle = handles[_H_FTMS_STATUS]
+        self.ftms_training_status_handle = handles[_H_FTMS_TRAINING_STATUS]
+        self.ftms_resistance_range_handle = handles[_H_FTMS_RESISTANCE_RANGE]
+        self.ftms_inclination_range_handle = handles[_H_FTMS_INCLINATION_RANGE]
+
+        self.cscs_measurement_handle = handles[_H_CSCS_MEASUREMENT]
+        self.cscs_feature_handle = handles[_H_CSCS_FEATURE]
 
         # Set initial values
         self._set_feature_values()
@@ -345,178 +568,302 @@ class BLEController:
             _TF_INDOOR_BIKE_SIM
         )
         ftms_feature_data = struct.pack("<II", machine_features, target_features)
-        self.ble.gatts_write(self.ftms_feature_handle, ftms_feature_data)
+        self._gatts_write(self.ftms_feature_handle, ftms_feature_data)
 
         # CSCS Feature: Wheel and Crank supported
         cscs_feature_data = struct.pack("<H", 0x0003)
-        self.ble.gatts_write(self.cscs_feature_handle, cscs_feature_data)
+        self._gatts_write(self.cscs_feature_handle, cscs_feature_data)
 
         # Training status: Idle
         training_status = struct.pack("<BB", 0x00, 0x01)  # flags=0, status=Idle
-        self.ble.gatts_write(self.ftms_training_status_handle, training_status)
+        self._gatts_write(self.ftms_training_status_handle, training_status)
 
     def _set_range_values(self):
         """Set FTMS range characteristic values."""
         # Resistance Level Range: min, max, increment (sint16 * 0.1)
         # Range: 1 to 100 (0.1% to 10.0%)
         resistance_range = struct.pack("<hhh", 10, 1000, 10)  # 1.0 to 100.0, step 1.0
-        self.ble.gatts_write(self.ftms_resistance_range_handle, resistance_range)
+        self._gatts_write(self.ftms_resistance_range_handle, resistance_range)
 
         # Inclination Range: min, max, increment (sint16 * 0.1%)
         # Range: -20.0% to +20.0%
         inclination_range = struct.pack("<hhh", -200, 200, 1)  # -20.0 to +20.0, step 0.1
-        self.ble.gatts_write(self.ftms_inclination_range_handle, inclination_range)
+        self._gatts_write(self.ftms_inclination_range_handle, inclination_range)
 
-    def _advertise(self):
-        """Start BLE advertising."""
-        try:
-            self.ble.gap_advertise(None)
-        except:
-            pass
+    def _build_adv_data(self, name):
+        """Build the advertising payload for the given device name.
 
-        display_name = self.pairing_name if self.pairing_mode else self.normal_name
-        name_bytes = bytes(display_name[:16], "utf-8")
+        Args:
+            name: Device name to advertise (truncated to 16 bytes).
 
-        adv_data = bytearray()
+        Returns:
+            Advertising data as bytes (flags, name, FTMS UUID16).
+        """
+        name_bytes = bytes(name, "utf-8")[:16]
+        name_len = len(name_bytes)
+        # Fixed TLV layout: flags (3) + name (2 + N) + FTMS UUID16 (4) <= 25 bytes
+        buf = bytearray(9 + name_len)
         # Flags
-        adv_data.extend(struct.pack("BBB", 2, _ADV_TYPE_FLAGS, 0x06))
+        buf[0] = 2
+        buf[1] = _ADV_TYPE_FLAGS
+        buf[2] = 0x06
         # Name
-        adv_data.extend(struct.pack("BB", len(name_bytes) + 1, _ADV_TYPE_NAME))
-        adv_data.extend(name_bytes)
+        buf[3] = name_len + 1
+        buf[4] = _ADV_TYPE_NAME
+        buf[5:5 + name_len] = name_bytes
         # FTMS UUID (16-bit)
-        if len(adv_data) + 4 <= 31:
-            adv_data.extend(struct.pack("BB", 3, _ADV_TYPE_UUID16_COMPLETE))
-            adv_data.extend(struct.pack("<H", 0x1826))
+        i = 5 + name_len
+        struct.pack_into("<BBH", buf, i, 3, _ADV_TYPE_UUID16_COMPLETE, _FTMS_UUID16)
+        return bytes(buf)
+
+    def _advertise(self):
+        """Start BLE advertising.
 
-        adv_interval = 100000 if self.pairing_mode else 200000
-        self.ble.gap_advertise(adv_interval, adv_data=adv_data)
-        print(f"BLE: Advertising as '{display_name}' (FTMS)")
+        gap_advertise() replaces any advertising already in progress, so
+        there is no need to stop it first.
+        """
+        if self.pairing_mode:
+            self.ble.gap_advertise(_ADV_INTERVAL_PAIRING_US, adv_data=self._adv_pairing)
+        else:
+            self.ble.gap_advertise(_ADV_INTERVAL_NORMAL_US, adv_data=self._adv_normal)
+        if _DEBUG:
+            print(f"BLE: Advertising as '{self.pairing_name if self.pairing_mode else self.normal_name}' (FTMS)")
 
+    @micropython.native
     def _handle_control_point(self, value):
-        """Handle FTMS Control Point writes."""
+        """Handle FTMS Control Point writes.
+
+        Dispatches through the _CP_HANDLERS table, then indicates the
+        response (response code, op code, result).
+        """
         if len(value) < 1:
             return
 
         op_code = value[0]
-        result = _RESULT_SUCCESS
-        response_params = bytes()
 
-        print(f"BLE: Control Point Op={op_code:#x} Data={value.hex()}")
+        if _DEBUG:
+            print("BLE: Control Point Op", op_code, "len", len(value))
 
-        if op_code == _CP_REQUEST_CONTROL:
-            self.control_granted = True
-            print("BLE: Control granted")
+        handler = self._CP_HANDLERS.get(op_code)
+        if handler is not None:
+            result = handler(self, value)
+        else:
+            result = _RESULT_NOT_SUPPORTED
+        if _DEBUG and result != _RESULT_SUCCESS:
+            # Full payload dump only on the error paths
+            print("BLE: Control Point Op", op_code, "failed", result, value.hex())
 
-        elif op_code == _CP_RESET:
-            self.target_incline = 0.0
-            self.target_resistance = 0
-            self.target_power = 0
-            self._notify_status(_STATUS_RESET)
+        # Send response
+        response = self._cp_response_buf
+        response[0] = _CP_RESPONSE_CODE
+        response[1] = op_code
+        response[2] = result
+        if not self.connected:
+            return
+        handle = self.ftms_control_point_handle
+        if self._indicate_with_data:
+            # Control point isn't readable, so the stored value needn't be updated
+            try:
+                self._gatts_indicate(self.conn_handle, handle, response)
+            except TypeError:
+                # Older firmware: indicate takes no data argument
+                self._indicate_with_data = False
+        if not self._indicate_with_data:
+            self._gatts_write(handle, response)
+            self._gatts_indicate(self.conn_handle, handle)
+        self._indicate_in_flight = True
+        self._indicate_sent_at = _ticks_ms()
+
+    def _cp_request_control(self, value):
+        """Handle Request Control (0x00)."""
+        self.control_granted = True
+        if _DEBUG:
+            print("BLE: Control granted")
+        return _RESULT_SUCCESS
+
+    def _cp_reset(self, value):
+        """Handle Reset (0x01)."""
+        self.target_incline = 0.0
+        self.target_resistance = 0
+        self.target_power = 0
+        self._notify_status(_STATUS_RESET)
+        if _DEBUG:
             print("BLE: Reset")
-
-        elif op_code == _CP_SET_TARGET_INCLINATION:
-            if len(value) >= 3:
-                # Inclination in 0.1% units (sint16)
-                incline_raw = struct.unpack("<h", value[1:3])[0]
-                self.target_incline = incline_raw / 10.0
-                if self.load_controller:
-                    self.load_controller.set_incline(self.target_incline)
-                self._notify_status(_STATUS_TARGET_INCLINE_CHANGED, value[1:3])
-                print(f"BLE: Target incline = {self.target_incline:.1f}%")
-            else:
-                result = _RESULT_INVALID_PARAM
-
-        elif op_code == _CP_SET_TARGET_RESISTANCE:
-            if len(value) >= 3:
-                # Resistance in 0.1 units (sint16)
-                self.target_resistance = struct.unpack("<h", value[1:3])[0]
-                resistance_pct = self.target_resistance / 10.0
-                if self.load_controller:
-                    # Convert resistance (0-100) to incline for our system
-                    self.load_controller.set_incline(resistance_pct)
-                self._notify_status(_STATUS_TARGET_RESISTANCE_CHANGED, value[1:3])
-                print(f"BLE: Target resistance = {resistance_pct:.1f}")
-            else:
-                result = _RESULT_INVALID_PARAM
-
-        elif op_code == _CP_SET_TARGET_POWER:
-            if len(value) >= 3:
-                self.target_power = struct.unpack("<H", value[1:3])[0]
-                self._notify_status(_STATUS_TARGET_POWER_CHANGED, value[1:3])
-                print(f"BLE: Target power = {self.target_power}W")
-            else:
-                result = _RESULT_INVALID_PARAM
-
-        elif op_code == _CP_START_OR_RESUME:
-            self._notify_status(_STATUS_STARTED_RESUMED)
-            self._notify_training_status(0x04)  # Running
+        return _RESULT_SUCCESS
+
+    def _cp_set_target_inclination(self, value):
+        """Handle Set Target Inclination (0x03)."""
+        if len(value) < 3:
+            return _RESULT_INVALID_PARAM
+        # Inclination in 0.1% units (sint16)
+        incline_raw = _sint16_at(value, 1)
+        self.target_incline = incline_raw / 10.0
+        self._schedule_incline(self.target_incline)
+        self._notify_status(_STATUS_TARGET_INCLINE_CHANGED, value, 1, 2)
+        if _DEBUG:
+            print("BLE: Target incline (0.1%)", incline_raw)
+        return _RESULT_SUCCESS
+
+    def _cp_set_target_resistance(self, value):
+        """Handle Set Target Resistance Level (0x04)."""
+        if len(value) < 3:
+            return _RESULT_INVALID_PARAM
+        # Resistance in 0.1 units (sint16)
+        self.target_resistance = _sint16_at(value, 1)
+        resistance_pct = self.target_resistance / 10.0
+        # Convert resistance (0-100) to incline for our system
+        self._schedule_incline(resistance_pct)
+        self._notify_status(_STATUS_TARGET_RESISTANCE_CHANGED, value, 1, 2)
+        if _DEBUG:
+            print("BLE: Target resistance (0.1)", self.target_resistance)
+        return _RESULT_SUCCESS
+
+    def _cp_set_target_power(self, value):
+        """Handle Set Target Power (0x05)."""
+        if len(value) < 3:
+            return _RESULT_INVALID_PARAM
+        self.target_power = _uint16_at(value, 1)
+        self._notify_status(_STATUS_TARGET_POWER_CHANGED, value, 1, 2)
+        if _DEBUG:
+            print("BLE: Target power (W)", self.target_power)
+        return _RESULT_SUCCESS
+
+    def _cp_start_or_resume(self, value):
+        """Handle Start or Resume (0x07)."""
+        self._notify_status(_STATUS_STARTED_RESUMED)
+        self._notify_training_status(0x04)  # Running
+        if _DEBUG:
             print("BLE: Started/Resumed")
+        return _RESULT_SUCCESS
 
-        elif op_code == _CP_STOP_OR_PAUSE:
-            param = value[1] if len(value) > 1 else 0x01
-            self._notify_status(_STATUS_STOPPED_PAUSED, bytes([param]))
-            self._notify_training_status(0x01)  # Idle
+    def _cp_stop_or_pause(self, value):
+        """Handle Stop or Pause (0x08)."""
+        if len(value) > 1:
+            self._notify_status(_STATUS_STOPPED_PAUSED, value, 1, 1)
+        else:
+            self._notify_status(_STATUS_STOPPED_PAUSED, _STOP_PARAM_DEFAULT, 0, 1)
+        self._notify_training_status(0x01)  # Idle
+        if _DEBUG:
             print("BLE: Stopped/Paused")
+        return _RESULT_SUCCESS
+
+    def _cp_set_indoor_bike_sim(self, value):
+        """Handle Set Indoor Bike Simulation Parameters (0x11)."""
+        if len(value) < 7:
+            return _RESULT_INVALID_PARAM
+        # Wind speed (sint16, m/s * 1000)
+        self.sim_wind_speed = _sint16_at(value, 1)
+        # Grade (sint16, % * 100)
+        self.sim_grade = _sint16_at(value, 3)
+        # CRR (uint8, * 10000)
+        self.sim_crr = value[5]
+        # CW (uint8, kg/m * 100)
+        self.sim_cw = value[6]
+
+        # Apply grade as incline with scaling
+        # FTMS grade is typically -20% to +20% (realistic road grades)
+        # LoadController expects -100 to +100 for full resistance range
+        # Scale by 5x so a 10% grade feels appropriately hard:
+        #   0% grade → 0% incline (baseline resistance)
+        #   10% grade → 50% incline (hard climb)
+        #   20% grade → 100% incline (max resistance)
+        #   -10% grade → -50% incline (easier descent)
+        grade_pct = self.sim_grade / 100.0
+        scaled_incline = grade_pct * 5.0  # Scale factor: 5x
+        scaled_incline = max(-100.0, min(100.0, scaled_incline))  # Clamp to valid range
+
+        self.target_incline = scaled_incline
+        self._schedule_incline(scaled_incline)
+
+        self._notify_status(_STATUS_INDOOR_BIKE_SIM_CHANGED, value, 1, 6)
+        if _DEBUG:
+            print("BLE: Sim grade (0.01%)", self.sim_grade)
+        return _RESULT_SUCCESS
+
+    # Control point op code -> handler dispatch table (unbound functions, called with self)
+    _CP_HANDLERS = {
+        _CP_REQUEST_CONTROL: _cp_request_control,
+        _CP_RESET: _cp_reset,
+        _CP_SET_TARGET_INCLINATION: _cp_set_target_inclination,
+        _CP_SET_TARGET_RESISTANCE: _cp_set_target_resistance,
+        _CP_SET_TARGET_POWER: _cp_set_target_power,
+        _CP_START_OR_RESUME: _cp_start_or_resume,
+        _CP_STOP_OR_PAUSE: _cp_stop_or_pause,
+        _CP_SET_INDOOR_BIKE_SIM: _cp_set_indoor_bike_sim,
+    }
+
+    def _schedule_incline(self, incline):
+        """Queue an incline change to be applied outside the BLE IRQ.
+
+        Last write wins: repeated calls before the scheduled callback runs
+        just replace the pending value. Changes within _INCLINE_DEADBAND of
+        the current load controller incline are dropped when applied.
 
-        elif op_code == _CP_SET_INDOOR_BIKE_SIM:
-            if len(value) >= 7:
-                # Wind speed (sint16, m/s * 1000)
-                self.sim_wind_speed = struct.unpack("<h", value[1:3])[0]
-                # Grade (sint16, % * 100)
-                self.sim_grade = struct.unpack("<h", value[3:5])[0]
-                # CRR (uint8, * 10000)
-                self.sim_crr = value[5]
-                # CW (uint8, kg/m * 100)
-                self.sim_cw = value[6]
-                
-                # Apply grade as incline with scaling
-                # FTMS grade is typically -20% to +20% (realistic road grades)
-                # LoadController expects -100 to +100 for full resistance range
-                # Scale by 5x so a 10% grade feels appropriately hard:
-                #   0% grade → 0% incline (baseline resistance)
-                #   10% grade → 50% incline (hard climb)
-                #   20% grade → 100% incline (max resistance)
-                #   -10% grade → -50% incline (easier descent)
-                grade_pct = self.sim_grade / 100.0
-                scaled_incline = grade_pct * 5.0  # Scale factor: 5x
-                scaled_incline = max(-100.0, min(100.0, scaled_incline))  # Clamp to valid range
-                
-                self.target_incline = scaled_incline
-                if self.load_controller:
-                    self.load_controller.set_incline(scaled_incline)
-                
-                self._notify_status(_STATUS_INDOOR_BIKE_SIM_CHANGED, value[1:7])
-                print(f"BLE: Sim params - grade={grade_pct:.2f}% -> incline={scaled_incline:.1f}%")
-            else:
-                result = _RESULT_INVALID_PARAM
+        Args:
+            incline: Incline percentage to pass to the load controller.
+        """
+        if self.load_controller is None:
+            return
+        self._pending_incline = incline
+        if self._incline_scheduled:
+            return
+        try:
+            schedule(self._apply_pending_incline_cb, None)
+            self._incline_scheduled = True
+        except RuntimeError:
+            # Schedule queue full - apply now rather than drop the change
+            self._apply_pending_incline(None)
 
-        else:
-            result = _RESULT_NOT_SUPPORTED
-            print(f"BLE: Unsupported op code {op_code:#x}")
+    def _apply_pending_incline(self, _arg):
+        """Apply the latest pending incline (scheduled callback).
 
-        # Send response
-        response = struct.pack("<BBB", _CP_RESPONSE_CODE, op_code, result)
-        response += response_params
-        self.ble.gatts_write(self.ftms_control_point_handle, response)
-        if self.connected:
-            self.ble.gatts_indicate(self.conn_handle, self.ftms_control_point_handle)
-
-    def _notify_status(self, status_code, params=bytes()):
-        """Notify FTMS status change."""
-        if not self.connected:
+        Args:
+            _arg: Unused (required by micropython.schedule).
+        """
+        self._incline_scheduled = False
+        load_controller = self.load_controller
+        if load_controller is None:
+            return
+        incline = self._pending_incline
+        # Compare against the load controller, not the last app write, so
+        # button changes in between are not masked by the deadband
+        if abs(incline - load_controller.get_incline()) < _INCLINE_DEADBAND:
             return
-        status_data = bytes([status_code]) + params
-        self.ble.gatts_write(self.ftms_status_handle, status_data)
-        self.ble.gatts_notify(self.conn_handle, self.ftms_status_handle, status_data)
+        load_controller.set_incline(incline)
 
+    @micropython.native
+    def _notify_status(self, status_code, params=None, offset=0, length=0):
+        """Notify FTMS status change.
+
+        Args:
+            status_code: FTMS machine status op code.
+            params: Buffer holding the status parameters (default: None).
+            offset: Start of the parameters within params (default: 0).
+            length: Number of parameter bytes (default: 0).
+        """
+        if not self.connected:
+            return
+        buf = self._status_buf
+        buf[0] = status_code
+        for i in range(length):
+            buf[1 + i] = params[offset + i]
+        # Notify-only characteristic: send the value with the notification
+        self._gatts_notify(self.conn_handle, self.ftms_status_handle,
+                           self._status_views[1 + length])
+
+    @micropython.native
     def _notify_training_status(self, status):
         """Notify training status change."""
         if not self.connected:
             return
-        data = struct.pack("<BB", 0x00, status)
-        self.ble.gatts_write(self.ftms_training_status_handle, data)
-        self.ble.gatts_notify(self.conn_handle, self.ftms_training_status_handle, data)
-
+        data = self._training_status_buf
+        data[0] = 0x00
+        data[1] = status
+        # Readable too, so the stored value must be kept current
+        self._gatts_write(self.ftms_training_status_handle, data)
+        self._gatts_notify(self.conn_handle, self.ftms_training_status_handle, data)
+
+    @micropython.native
     def update_indoor_bike_data(self):
         """Broadcast FTMS Indoor Bike Data."""
         if not self.connected:
@@ -524,16 +871,18 @@ class BLEController:
 
         try:
             # Get current values
+            speed_controller = self.speed_controller
+            load_controller = self.load_controller
             speed_mph = 0.0
             cadence_rpm = 0.0
             resistance_pct = 0.0
 
-            if self.speed_controller:
-                speed_mph = self.speed_controller.get_calculated_speed() or 0.0
-                cadence_rpm = self.speed_controller.get_crank_rpm() or 0.0
+            if speed_controller:
+                speed_mph = speed_controller.get_calculated_speed() or 0.0
+                cadence_rpm = speed_controller.get_crank_rpm() or 0.0
 
-            if self.load_controller:
-                resistance_pct = self.load_controller.get_current_load_percent() or 0.0
+            if load_controller:
+                resistance_pct = load_controller.get_current_load_percent() or 0.0
 
             # Convert speed from mph to FTMS units (km/h * 100)
             # SpeedController returns mph, FTMS requires km/h with 0.01 resolution
@@ -561,7 +910,7 @@ class BLEController:
             # - Bit 2 = 1: Instantaneous Cadence present
             # - Bit 5 = 1: Resistance Level present
             # - Bit 6 = 1: Instantaneous Power present
-            flags = _IBD_INST_CADENCE | _IBD_RESISTANCE_LEVEL | _IBD_INST_POWER
+            # (precomputed as _IBD_FLAGS)
 
             # Data order must match FTMS spec Table 4.9:
             # 1. Flags (uint16)
@@ -569,77 +918,141 @@ class BLEController:
             # 3. Instantaneous Cadence (uint16) - present because bit 2 = 1
             # 4. Resistance Level (sint16) - present because bit 5 = 1
             # 5. Instantaneous Power (sint16) - present because bit 6 = 1
-            data = struct.pack("<H", flags)           # Flags (2 bytes)
-            data += struct.pack("<H", speed_ftms)     # Instantaneous Speed (2 bytes, uint16)
-            data += struct.pack("<H", cadence_ftms)   # Instantaneous Cadence (2 bytes, uint16)
-            data += struct.pack("<h", resistance_ftms)  # Resistance Level (2 bytes, sint16)
-            data += struct.pack("<h", power_watts)    # Instantaneous Power (2 bytes, sint16)
-
-            self.ble.gatts_write(self.ftms_indoor_bike_data_handle, data)
-            self.ble.gatts_notify(self.conn_handle, self.ftms_indoor_bike_data_handle, data)
+            data = self._ibd_buf
+            struct.pack_into(_IBD_FORMAT, data, 0, _IBD_FLAGS, speed_ftms, cadence_ftms,
+                             resistance_ftms, power_watts)
+
+            # Skip unchanged frames, but refresh periodically for apps that
+            # treat Indoor Bike Data as a heartbeat
+            last_ibd = self._last_ibd
+            if (self._last_ibd_valid and data == last_ibd and
+                    self._ibd_unchanged < _IBD_REFRESH_EVERY - 1):
+                self._ibd_unchanged += 1
+                return
+            last_ibd[:] = data
+            self._ibd_unchanged = 0
+            self._last_ibd_valid = True
+
+            # Notify-only characteristic: send the value with the notification
+            self._gatts_notify(self.conn_handle, self.ftms_indoor_bike_data_handle, data)
 
         except Exception as e:
             print(f"BLE: Error in indoor bike data: {e}")
 
+    @micropython.native
     def update_csc_data(self):
         """Broadcast CSC (speed/cadence) data."""
         if not self.connected:
             return
 
         try:
-            current_time = utime.ticks_ms()
-            current_time_1024 = current_time * 1024 // 1000
+            speed_controller = self.speed_controller
+            wheel_revs = self._wheel_revs
+            crank_revs = self._crank_revs
+            event_times = self._csc_event_times
+
+            # Revolution counts and event times come straight from the
+            # sensor interrupt handlers, as the CSC spec expects
+            if speed_controller:
+                wheel_count, wheel_time = speed_controller.get_wheel_revolution_data()
+                crank_count, crank_time = speed_controller.get_crank_revolution_data()
+                wheel_revs[0] = wheel_count
+                crank_revs[0] = crank_count
+                event_times[0] = _ms_to_1024(wheel_time)
+                event_times[1] = _ms_to_1024(crank_time)
 
-            wheel_rpm = 0.0
-            crank_rpm = 0.0
+            # Build CSC data (wheel + crank)
+            data = self._csc_buf
+            struct.pack_into(_CSC_FORMAT, data, 0, _CSC_FLAGS,
+                             wheel_revs[0], event_times[0],
+                             crank_revs[0], event_times[1])
+
+            # Counts and event times only change on a sensor pulse, so an
+            # identical frame carries no new information
+            last_csc = self._last_csc
+            if self._last_csc_valid and data == last_csc:
+                return
+            last_csc[:] = data
+            self._last_csc_valid = True
+
+            # Notify-only characteristic: send the value with the notification
+            self._gatts_notify(self.conn_handle, self.cscs_measurement_handle, data)
 
-            if self.speed_controller:
-                wheel_rpm = self.speed_controller.get_wheel_rpm() or 0.0
-                crank_rpm = self.speed_controller.get_crank_rpm() or 0.0
+        except Exception as e:
+            print(f"BLE: Error in CSC data: {e}")
 
-            # Update cumulative counters
-            if self.last_update_time > 0:
-                dt_sec = utime.ticks_diff(current_time, self.last_update_time) / 1000.0
-                if wheel_rpm > 0:
-                    self.wheel_revolutions += int((wheel_rpm / 60.0) * dt_sec)
-                    self.last_wheel_event_time = current_time_1024 & 0xFFFF
-                if crank_rpm > 0:
-                    self.crank_revolutions += int((crank_rpm / 60.0) * dt_sec)
-                    self.last_crank_event_time = current_time_1024 & 0xFFFF
+    def _can_notify(self, current_time):
+        """Check notification pacing and claim the slot if free.
 
-            self.last_update_time = current_time
+        Refuses if the previous burst was sent less than _MIN_NOTIFY_MS ago,
+        or while a control point indication is still awaiting its ack (up to
+        _INDICATE_TIMEOUT_MS), so notifications are never queued faster than
+        the link can drain them.
 
-            # Build CSC data (wheel + crank)
-            flags = 0x03  # Both wheel and crank present
-            data = struct.pack("<B", flags)
-            data += struct.pack("<I", self.wheel_revolutions & 0xFFFFFFFF)
-            data += struct.pack("<H", self.last_wheel_event_time)
-            data += struct.pack("<H", self.crank_revolutions & 0xFFFF)
-            data += struct.pack("<H", self.last_crank_event_time)
+        Args:
+            current_time: Current time in milliseconds.
 
-            self.ble.gatts_write(self.cscs_measurement_handle, data)
-            self.ble.gatts_notify(self.conn_handle, self.cscs_measurement_handle, data)
+        Returns:
+            True if a burst may be sent now.
+        """
+        if _ticks_diff(current_time, self._last_notify_time) < _MIN_NOTIFY_MS:
+            return False
+        if self._indicate_in_flight:
+            if _ticks_diff(current_time, self._indicate_sent_at) < _INDICATE_TIMEOUT_MS:
+                return False
+            self._indicate_in_flight = False  # Ack missed - don't stall forever
+        self._last_notify_time = current_time
+        return True
+
+    def _on_notify_timer(self, _timer):
+        """Notify timer callback (IRQ context - defer the work).
 
-        except Exception as e:
-            print(f"BLE: Error in CSC data: {e}")
+        Args:
+            _timer: The Timer that fired (unused).
+        """
+        try:
+            schedule(self._notify_tick_cb, None)
+        except RuntimeError:
+            pass  # Schedule queue full - catch the next tick
 
-    def update(self):
-        """Update all BLE data broadcasts. Call this regularly."""
-        self.update_indoor_bike_data()
+    def _notify_tick(self, _arg):
+        """Send CSC data every tick and Indoor Bike Data every _IBD_NOTIFY_EVERY ticks.
+
+        Args:
+            _arg: Unused (required by micropython.schedule).
+        """
+        if not self.connected:
+            return
+        # Never send a frame the negotiated MTU would truncate
+        if self._max_payload(self.conn_handle) < _DATA_FRAME_MAX:
+            return
+        if not self._can_notify(_ticks_ms()):
+            return
         self.update_csc_data()
+        count = self._notify_tick_count
+        if count == 0:
+            self.update_indoor_bike_data()
+        count += 1
+        self._notify_tick_count = 0 if count >= _IBD_NOTIFY_EVERY else count
 
-    # Compatibility methods
-    def update_combined_data(self):
-        """Alias for update() - maintains compatibility."""
-        self.update()
+    def update(self):
+        """Send Indoor Bike Data and CSC data immediately.
 
-    def update_incline_value(self):
-        """Update incline (included in indoor bike data)."""
-        pass  # Handled in update_indoor_bike_data
+        Not needed in the main loop - notifications are timer driven while a
+        central is connected. Kept for callers that want an explicit update.
+        """
+        if self._max_payload(self.conn_handle) < _DATA_FRAME_MAX:
+            return
+        if not self._can_notify(_ticks_ms()):
+            return
+        self.update_indoor_bike_data()
+        self.update_csc_data()
 
-    def update_load_value(self):
-        """Update load (included in indoor bike data)."""
-        pass  # Handled in update_indoor_bike_data
+    def close(self):
+        """Stop notification and pairing timers and advertising."""
+        self._notify_timer.deinit()
+        self._pairing_timer.deinit()
+        self.ble.gap_advertise(None)
 
     def is_connected(self):
         """Check if BLE is connected."""
@@ -659,24 +1072,53 @@ class BLEController:
         if self.pairing_mode:
             return
         self.pairing_mode = True
-        self.pairing_mode_start_time = utime.ticks_ms()
+        self.pairing_mode_start_time = _ticks_ms()
+        self._pairing_deadline = utime.ticks_add(self.pairing_mode_start_time,
+                                                 self.pairing_mode_duration_ms)
+        self._pairing_timer.init(mode=Timer.ONE_SHOT, period=self.pairing_mode_duration_ms,
+                                 callback=self._on_pairing_timer_cb)
         self._advertise()
-        print("BLE: Pairing mode started")
+        if _DEBUG:
+            print("BLE: Pairing mode started")
 
     def stop_pairing_mode(self):
         """Stop pairing mode."""
         if not self.pairing_mode:
             return
         self.pairing_mode = False
+        self._pairing_timer.deinit()
         self._advertise()
-        print("BLE: Pairing mode stopped")
+        if _DEBUG:
+            print("BLE: Pairing mode stopped")
+
+    def _on_pairing_timer(self, _timer):
+        """Pairing timeout timer callback (IRQ context - defer the work).
+
+        Args:
+            _timer: The Timer that fired (unused).
+        """
+        try:
+            schedule(self._pairing_timeout_cb, None)
+        except RuntimeError:
+            # Schedule queue full - nothing else ends pairing mode, so retry
+            self._pairing_timer.init(mode=Timer.ONE_SHOT, period=_PAIRING_RETRY_MS,
+                                     callback=self._on_pairing_timer_cb)
+
+    def _pairing_timeout(self, _arg):
+        """End pairing mode after its timeout (scheduled callback).
+
+        Args:
+            _arg: Unused (required by micropython.schedule).
+        """
+        self.stop_pairing_mode()
 
     def update_pairing_mode(self, current_time):
-        """Check pairing mode timeout."""
-        if not self.pairing_mode:
-            return
-        elapsed = utime.ticks_diff(current_time, self.pairing_mode_start_time)
-        if elapsed >= self.pairing_mode_duration_ms:
+        """Check pairing mode timeout.
+
+        Not needed in the main loop - a one-shot timer ends pairing mode.
+        Kept for callers that poll explicitly.
+        """
+        if self.pairing_mode and _ticks_diff(current_time, self._pairing_deadline) >= 0:
             self.stop_pairing_mode()
 
     def is_pairing_mode(self):
@@ -698,7 +1140,8 @@ class BLEController:
             'connected': self.connected,
             'pairing_mode': self.pairing_mode,
             'device_name': self.name,
-            'control_granted': self.control_granted
+            'control_granted': self.control_granted,
+            'max_payload': self._max_payload(self.conn_handle) if self.connected else None
         }
 
     def print_status(self):
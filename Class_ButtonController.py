@@ -1,5 +1,45 @@
-from machine import Pin
+import array
+from machine import Pin, Timer, disable_irq, enable_irq, mem32
+import micropython
+from micropython import const
 import utime
+from Class_View import DIRTY_SPEED, DIRTY_TIMER, DIRTY_GEAR, DIRTY_ALL
+
+# Button GPIO pins
+_PIN_INCREASE_INCLINE = const(16)
+_PIN_DECREASE_INCLINE = const(17)
+_PIN_DECREMENT_GEAR = const(3)
+_PIN_INCREMENT_GEAR = const(2)
+_PIN_CONTROL = const(18)
+
+# RP2040 SIO GPIO_IN register - all GPIO input levels in one word
+_SIO_GPIO_IN = const(0xD0000004)
+
+# Button bits in the packed state mask (1 = released, pull-ups)
+_BTN_INCREASE_INCLINE = const(0x01)
+_BTN_DECREASE_INCLINE = const(0x02)
+_BTN_DECREMENT_GEAR = const(0x04)
+_BTN_INCREMENT_GEAR = const(0x08)
+_BTN_CONTROL = const(0x10)
+_BTN_ALL = const(0x1F)
+
+# Slots in last_button_action_time (buttons with timestamp debouncing)
+_DEBOUNCE_INCREASE_INCLINE = const(0)
+_DEBOUNCE_DECREASE_INCLINE = const(1)
+_DEBOUNCE_CONTROL = const(2)
+
+# Set to 1 to log button actions (gear clicks, timer reset, pairing).
+# Logging is compiled out entirely when 0.
+_DEBUG = const(0)
+
+_SCAN_PERIOD_MS = const(6)  # Button sampling period
+_DEBOUNCE_TICKS = const(2)  # Quiet scans before a new button state is committed (~12 ms)
+_TIMER_RESET_HOLD_MS = const(3000)  # Control button hold that resets a paused timer
+
+# Bind frequently used functions once (avoids module attribute lookups)
+_ticks_ms = utime.ticks_ms
+_ticks_diff = utime.ticks_diff
+_ticks_add = utime.ticks_add
 
 
 class ButtonController:
@@ -12,7 +52,7 @@ class ButtonController:
     def __init__(self, speed_controller=None, load_controller=None,
                  gear_selector=None, timer_controller=None, ble_controller=None,
                  view=None, incline_step=5.0, max_incline=100.0, min_incline=-100.0,
-                 debounce_ms=200, gear_click_timeout_ms=800):
+                 debounce_ms=10, gear_click_timeout_ms=800):
         """Initialize the button controller.
 
         Args:
@@ -24,7 +64,9 @@ class ButtonController:
             incline_step: Incline change per button press in percent (default: 5.0).
             max_incline: Maximum incline percentage (default: 100.0).
             min_incline: Minimum incline percentage (default: -100.0).
-            debounce_ms: Debounce delay in milliseconds for most buttons (default: 200).
+            debounce_ms: Minimum time in milliseconds between repeated incline or
+                         timer actions (default: 10). Contact bounce is already
+                         filtered by the scan timer.
             gear_click_timeout_ms: Timeout in milliseconds after last click before applying gear changes (default: 800).
                                     Allows for slower, more deliberate clicking while still being responsive.
         """
@@ -40,238 +82,358 @@ class ButtonController:
         self.debounce_ms = debounce_ms
         self.gear_click_timeout_ms = gear_click_timeout_ms
 
-        # Multi-click tracking for gear buttons
-        self.increment_click_count = 0
-        self.decrement_click_count = 0
-        self.increment_last_click_time = 0
-        self.decrement_last_click_time = 0
-        self.increment_start_gear = None
-        self.decrement_start_gear = None
+        # Multi-click tracking for gear buttons: signed click count (+ up,
+        # - down), the gear clicking started from, and when to apply the jump.
+        # The first click is applied at once; later clicks are coalesced.
+        self._gear_delta = 0
+        self._gear_start = None
+        self._gear_deadline = 0
 
         # Initialize button pins
-        self.increase_incline_button = Pin(16, Pin.IN, Pin.PULL_UP)  # Increase incline (uphill)
-        self.decrease_incline_button = Pin(17, Pin.IN, Pin.PULL_UP)  # Decrease incline (downhill)
-        self.decrement_gear_button = Pin(3, Pin.IN, Pin.PULL_UP)  # Decrement gear
-        self.increment_gear_button = Pin(2, Pin.IN, Pin.PULL_UP)  # Increment gear
-        self.control_button = Pin(18, Pin.IN, Pin.PULL_UP)  # Control button (currently unused)
-
-        # Track previous button states for release detection
-        self.prev_increase_incline = 1
-        self.prev_decrease_incline = 1
-        self.prev_decrement_gear = 1
-        self.prev_increment_gear = 1
-        self.prev_control = 1
+        self.increase_incline_button = Pin(_PIN_INCREASE_INCLINE, Pin.IN, Pin.PULL_UP)  # Increase incline (uphill)
+        self.decrease_incline_button = Pin(_PIN_DECREASE_INCLINE, Pin.IN, Pin.PULL_UP)  # Decrease incline (downhill)
+        self.decrement_gear_button = Pin(_PIN_DECREMENT_GEAR, Pin.IN, Pin.PULL_UP)  # Decrement gear
+        self.increment_gear_button = Pin(_PIN_INCREMENT_GEAR, Pin.IN, Pin.PULL_UP)  # Increment gear
+        self.control_button = Pin(_PIN_CONTROL, Pin.IN, Pin.PULL_UP)  # Control button (currently unused)
+
+        # Committed button states packed one bit per button (all released)
+        self._prev_mask = _BTN_ALL
+        # Last sampled state and how many scans it has been stable for.
+        # Any edge on any button restarts the count (one shared debounce
+        # window, as QMK's sym_defer_g), and the sampled state is only
+        # committed to _prev_mask after _DEBOUNCE_TICKS quiet scans.
+        self._pending_mask = _BTN_ALL
+        self._quiet_ticks = _DEBOUNCE_TICKS
+        # Edges seen by the scan timer and not yet handled by check_buttons
+        self._pressed_latch = 0
+        self._released_latch = 0
 
         # Timestamp-based debouncing (more efficient than sleep)
-        self.last_button_action_time = {}  # Track last action time per button
+        self.last_button_action_time = array.array('i', (0, 0, 0))  # Indexed by _DEBOUNCE_*
 
         # Control button tracking for long press detection
-        self.control_button_press_time = 0  # When control button was pressed (for long press detection)
+        self._control_hold_ticks = 0  # Scan ticks the control button has been held
         self.control_button_held = False  # Track if control button is currently held
         self.pairing_mode_triggered = False  # Flag to prevent multiple pairing triggers
         self.pairing_long_press_duration_ms = 6000  # 6 seconds to trigger pairing mode
-
+        self._pairing_hold_ticks = self.pairing_long_press_duration_ms // _SCAN_PERIOD_MS
+
+        # One-shot timer for the 3 second "reset paused timer" hold, armed on
+        # press only when the timer is paused (avoids polling get_state())
+        self._timer_reset_timer = Timer()
+        self._timer_reset_due = False
+
+        # Sample the buttons from a periodic timer, so edges and hold times
+        # are caught at a fixed rate however long the main loop stalls.
+        # The timer only runs while a button is active: an edge interrupt
+        # starts it and it stops itself once every button has settled
+        # released, so an idle trainer does no button work at all.
+        # (Pin and Timer callbacks are both soft IRQs, so they never
+        # interrupt each other.)
+        self._scan_timer = Timer()
+        self._scanning = False
+        self._scan_buttons_cb = self._scan_buttons  # Bind once (no allocation in IRQ)
+        for pin in (self.increase_incline_button, self.decrease_incline_button,
+                    self.decrement_gear_button, self.increment_gear_button,
+                    self.control_button):
+            pin.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=self._edge_handler)
+
+    @micropython.native
     def check_buttons(self):
         """Check all buttons and perform associated actions.
 
         This method should be called in the main loop to continuously check for button releases.
-        Detects button release (transition from pressed to released) and triggers actions.
+        Detects button release (transition from pressed to released) and triggers actions
+        through the _RELEASE_HANDLERS table.
         Uses timestamp-based debouncing to avoid blocking the main loop.
+        Edges are latched by the scan timer (_scan_buttons); actions run here
+        so display and load updates stay on the main loop.
         """
-        current_time = utime.ticks_ms()
-
-        # Get current button states (check all buttons first to avoid missing rapid presses)
-        increase_incline_state = self.increase_incline_button.value()
-        decrease_incline_state = self.decrease_incline_button.value()
-        decrement_gear_state = self.decrement_gear_button.value()
-        increment_gear_state = self.increment_gear_button.value()
-        control_state = self.control_button.value()
-
-        # Increase incline (uphill) - detect release
-        if self.prev_increase_incline == 0 and increase_incline_state == 1:
-            last_action = self.last_button_action_time.get('increase_incline', 0)
-            if utime.ticks_diff(current_time, last_action) >= self.debounce_ms:
-                if self.load_controller is not None:
-                    current_incline = self.load_controller.get_incline()
-                    new_incline = min(current_incline + self.incline_step, self.max_incline)
-                    self.load_controller.set_incline(new_incline)
-                    self._force_display_update()
-                self.last_button_action_time['increase_incline'] = current_time
-        self.prev_increase_incline = increase_incline_state
-
-        # Decrease incline (downhill) - detect release
-        if self.prev_decrease_incline == 0 and decrease_incline_state == 1:
-            last_action = self.last_button_action_time.get('decrease_incline', 0)
-            if utime.ticks_diff(current_time, last_action) >= self.debounce_ms:
-                if self.load_controller is not None:
-                    current_incline = self.load_controller.get_incline()
-                    new_incline = max(current_incline - self.incline_step, self.min_incline)
-                    self.load_controller.set_incline(new_incline)
-                    self._force_display_update()
-                self.last_button_action_time['decrease_incline'] = current_time
-        self.prev_decrease_incline = decrease_incline_state
-
-        # Handle gear button multi-click counting and timeout
-        self._process_gear_clicks(current_time)
-
-        # Decrement gear - detect release and count clicks
-        if self.prev_decrement_gear == 0 and decrement_gear_state == 1:
-            if self.gear_selector is not None:
-                # Cancel any pending increment clicks when decrement is clicked
-                if self.increment_click_count > 0:
-                    print(f"Cancelled {self.increment_click_count} increment clicks")
-                    self.increment_click_count = 0
-                    self.increment_start_gear = None
-
-                # Start tracking if this is the first click
-                if self.decrement_click_count == 0:
-                    self.decrement_start_gear = self.gear_selector.current_gear
-                # Increment click count
-                self.decrement_click_count += 1
-                self.decrement_last_click_time = current_time
-                print(f"Gear decrement click #{self.decrement_click_count} (will apply after {self.gear_click_timeout_ms}ms delay)")
-        self.prev_decrement_gear = decrement_gear_state
-
-        # Increment gear - detect release and count clicks
-        if self.prev_increment_gear == 0 and increment_gear_state == 1:
-            if self.gear_selector is not None:
-                # Cancel any pending decrement clicks when increment is clicked
-                if self.decrement_click_count > 0:
-                    print(f"Cancelled {self.decrement_click_count} decrement clicks")
-                    self.decrement_click_count = 0
-                    self.decrement_start_gear = None
-
-                # Start tracking if this is the first click
-                if self.increment_click_count == 0:
-                    self.increment_start_gear = self.gear_selector.current_gear
-                # Increment click count
-                self.increment_click_count += 1
-                self.increment_last_click_time = current_time
-                print(f"Gear increment click #{self.increment_click_count} (will apply after {self.gear_click_timeout_ms}ms delay)")
-        self.prev_increment_gear = increment_gear_state
-
-        # Control button - Timer control and Pairing mode
-        # Detect button press (transition from released to pressed)
-        if self.prev_control == 1 and control_state == 0:
-            self.control_button_press_time = current_time
-            self.control_button_held = True
-            self.pairing_mode_triggered = False  # Reset when button is pressed again
+        current_time = _ticks_ms()
 
-        # Detect button release (transition from pressed to released)
-        if self.prev_control == 0 and control_state == 1:
-            self.control_button_held = False
-            hold_duration = utime.ticks_diff(current_time, self.control_button_press_time)
+        # Handle gear button multi-click timeout (skip the call when idle)
+        if self._gear_delta:
+            self._process_gear_clicks(current_time)
 
-            # Check for pairing mode (6 seconds = 6000ms)
-            if hold_duration >= self.pairing_long_press_duration_ms:
-                if self.ble_controller is not None and not self.pairing_mode_triggered:
-                    self.ble_controller.start_pairing_mode()
-                    self.pairing_mode_triggered = True
-                    print("Pairing mode activated (6 second control button press)")
-                    self._force_display_update()
-            # Check for timer reset (3 seconds = 3000ms) while paused
-            elif hold_duration >= 3000 and self.timer_controller is not None:
-                if self.timer_controller.get_state() == 'paused':
-                    # Reset timer
-                    self.timer_controller.reset()
-                    self._force_display_update()
-            # Check for short press (normal click) - timer start/pause/resume
-            elif hold_duration < 3000:
-                if self.timer_controller is not None:
-                    # Debounce check
-                    last_action = self.last_button_action_time.get('control', 0)
-                    if utime.ticks_diff(current_time, last_action) >= self.debounce_ms:
-                        self._handle_timer_toggle(current_time)
-                        self.last_button_action_time['control'] = current_time
+        if not (self._pressed_latch | self._released_latch) and not self.control_button_held:
+            return
+
+        # Take the latched edges atomically with respect to the scan timer
+        irq_state = disable_irq()
+        pressed = self._pressed_latch
+        released = self._released_latch
+        self._pressed_latch = 0
+        self._released_latch = 0
+        enable_irq(irq_state)
+        state = self._prev_mask
+
+        # Control button press (transition from released to pressed);
+        # the hold tick count was restarted by the scan timer
+        if pressed & _BTN_CONTROL:
+            self.control_button_held = True
+            self.pairing_mode_triggered = False  # Reset when button is pressed again
+            if self.timer_controller is not None and self.timer_controller.get_state() == 'paused':
+                self._timer_reset_due = False
+                self._timer_reset_timer.init(period=_TIMER_RESET_HOLD_MS, mode=Timer.ONE_SHOT,
+                                             callback=self._on_timer_reset_hold)
+
+        # Dispatch each released button, lowest bit first
+        handlers = self._RELEASE_HANDLERS
+        while released:
+            bit = released & -released
+            released ^= bit
+            handlers[bit](self, current_time)
 
         # Check for long press while button is still held
-        if self.control_button_held and control_state == 0:
-            hold_duration = utime.ticks_diff(current_time, self.control_button_press_time)
+        if self.control_button_held and not (state & _BTN_CONTROL):
+            # Timer reset (3 seconds) while paused - flagged by the one-shot timer
+            if self._timer_reset_due:
+                self._timer_reset_due = False
+                self.timer_controller.reset()
+                self.control_button_held = False
+                if _DEBUG:
+                    print("Timer reset (long press)")
+                self._invalidate(DIRTY_TIMER)
+                return
 
             # Check for pairing mode (6 seconds) - trigger immediately when reached
-            if (hold_duration >= self.pairing_long_press_duration_ms and
+            if (self._control_hold_ticks >= self._pairing_hold_ticks and
                 self.ble_controller is not None and not self.pairing_mode_triggered):
                 self.ble_controller.start_pairing_mode()
                 self.pairing_mode_triggered = True
-                print("Pairing mode activated (6 second control button press)")
-                self._force_display_update()
-            # Check for timer reset (3 seconds) while paused
-            elif (hold_duration >= 3000 and self.timer_controller is not None and
-                  self.timer_controller.get_state() == 'paused'):
-                # Reset timer immediately when 3 seconds reached
+                if _DEBUG:
+                    print("Pairing mode activated (6 second control button press)")
+                self._invalidate(DIRTY_ALL)
+
+    def _on_increase_incline_release(self, current_time):
+        """Increase incline (uphill) on button release."""
+        last_action_time = self.last_button_action_time
+        last_action = last_action_time[_DEBOUNCE_INCREASE_INCLINE]
+        if _ticks_diff(current_time, last_action) >= self.debounce_ms:
+            load_controller = self.load_controller
+            if load_controller is not None:
+                # Saturating add (compare instead of a min() builtin call)
+                incline = load_controller.get_incline()
+                new_incline = incline + self.incline_step
+                if new_incline > self.max_incline:
+                    new_incline = self.max_incline
+                # Already at the limit - nothing to update or redraw
+                if new_incline != incline:
+                    load_controller.set_incline(new_incline)
+                    self._invalidate(DIRTY_SPEED)
+            last_action_time[_DEBOUNCE_INCREASE_INCLINE] = current_time
+
+    def _on_decrease_incline_release(self, current_time):
+        """Decrease incline (downhill) on button release."""
+        last_action_time = self.last_button_action_time
+        last_action = last_action_time[_DEBOUNCE_DECREASE_INCLINE]
+        if _ticks_diff(current_time, last_action) >= self.debounce_ms:
+            load_controller = self.load_controller
+            if load_controller is not None:
+                # Saturating subtract (compare instead of a max() builtin call)
+                incline = load_controller.get_incline()
+                new_incline = incline - self.incline_step
+                if new_incline < self.min_incline:
+                    new_incline = self.min_incline
+                # Already at the limit - nothing to update or redraw
+                if new_incline != incline:
+                    load_controller.set_incline(new_incline)
+                    self._invalidate(DIRTY_SPEED)
+            last_action_time[_DEBOUNCE_DECREASE_INCLINE] = current_time
+
+    def _on_decrement_gear_release(self, current_time):
+        """Count a decrement gear click on button release."""
+        self._count_gear_click(-1, current_time)
+
+    def _on_increment_gear_release(self, current_time):
+        """Count an increment gear click on button release."""
+        self._count_gear_click(1, current_time)
+
+    def _count_gear_click(self, direction, current_time):
+        """Shift on the first gear click, then accumulate further clicks.
+
+        The first click changes gear immediately so a single click has no
+        delay. Further clicks before the deadline are added to the pending
+        jump, which _process_gear_clicks() applies once clicking stops.
+
+        Args:
+            direction: 1 for increment, -1 for decrement.
+            current_time: Current time in milliseconds.
+        """
+        if self.gear_selector is None:
+            return
+
+        delta = self._gear_delta
+        # Cancel any pending clicks in the opposite direction
+        if delta * direction < 0:
+            if _DEBUG:
+                print("Cancelled gear clicks:", delta)
+            delta = 0
+
+        # First click: start tracking and shift one gear straight away
+        if delta == 0:
+            start_gear = self.gear_selector.current_gear
+            self._gear_start = start_gear
+            self._set_gear(start_gear + direction)
+        delta += direction
+        self._gear_delta = delta
+        self._gear_deadline = _ticks_add(current_time, self.gear_click_timeout_ms)
+        if _DEBUG:
+            print("Gear click, pending delta:", delta)
+
+    def _on_control_release(self, current_time):
+        """Handle control button release - timer control and pairing mode."""
+        self.control_button_held = False
+        self._timer_reset_timer.deinit()
+        self._timer_reset_due = False
+        # Held time as counted by the scan timer up to the release
+        hold_duration = self._control_hold_ticks * _SCAN_PERIOD_MS
+
+        # Check for pairing mode (6 seconds = 6000ms)
+        if hold_duration >= self.pairing_long_press_duration_ms:
+            if self.ble_controller is not None and not self.pairing_mode_triggered:
+                self.ble_controller.start_pairing_mode()
+                self.pairing_mode_triggered = True
+                if _DEBUG:
+                    print("Pairing mode activated (6 second control button press)")
+                self._invalidate(DIRTY_ALL)
+        # Check for timer reset (3 seconds = 3000ms) while paused
+        elif hold_duration >= _TIMER_RESET_HOLD_MS and self.timer_controller is not None:
+            if self.timer_controller.get_state() == 'paused':
+                # Reset timer
                 self.timer_controller.reset()
-                self.control_button_held = False
-                print("Timer reset (long press)")
-                self._force_display_update()
+                self._invalidate(DIRTY_TIMER)
+        # Check for short press (normal click) - timer start/pause/resume
+        elif hold_duration < _TIMER_RESET_HOLD_MS:
+            if self.timer_controller is not None:
+                # Debounce check
+                last_action_time = self.last_button_action_time
+                last_action = last_action_time[_DEBOUNCE_CONTROL]
+                if _ticks_diff(current_time, last_action) >= self.debounce_ms:
+                    self._handle_timer_toggle(current_time)
+                    last_action_time[_DEBOUNCE_CONTROL] = current_time
+
+    # Button bit -> release handler dispatch table (unbound functions, called with self)
+    _RELEASE_HANDLERS = {
+        _BTN_INCREASE_INCLINE: _on_increase_incline_release,
+        _BTN_DECREASE_INCLINE: _on_decrease_incline_release,
+        _BTN_DECREMENT_GEAR: _on_decrement_gear_release,
+        _BTN_INCREMENT_GEAR: _on_increment_gear_release,
+        _BTN_CONTROL: _on_control_release,
+    }
+
+    def _on_timer_reset_hold(self, _timer):
+        """One-shot timer callback: control button held 3 s while paused.
+
+        Only sets a flag - the reset itself runs in check_buttons().
 
-        self.prev_control = control_state
+        Args:
+            _timer: The timer that fired (unused but required by MicroPython).
+        """
+        self._timer_reset_due = True
+
+    def _edge_handler(self, _pin):
+        """Interrupt handler for any button edge: start the scan timer.
 
+        Args:
+            _pin: The pin that triggered the interrupt (unused but required by MicroPython).
+        """
+        if not self._scanning:
+            self._scanning = True
+            self._scan_timer.init(period=_SCAN_PERIOD_MS, mode=Timer.PERIODIC,
+                                  callback=self._scan_buttons_cb)
+
+    @micropython.native
+    def _scan_buttons(self, _timer):
+        """Timer callback: sample all buttons and latch any edges.
+
+        IMPORTANT: Keep this handler minimal - no memory allocation!
+        Actions are performed later in check_buttons().
+
+        Args:
+            _timer: The timer that fired (unused but required by MicroPython).
+        """
+        # Sample all buttons in one register read (consistent snapshot) and
+        # move each pin's bit to its _BTN_* position. Mask before shifting
+        # left so the value stays a small int.
+        raw = mem32[_SIO_GPIO_IN]
+        state = (((raw >> _PIN_INCREASE_INCLINE) & _BTN_INCREASE_INCLINE) |
+                 ((raw >> (_PIN_DECREASE_INCLINE - 1)) & _BTN_DECREASE_INCLINE) |
+                 ((raw >> (_PIN_DECREMENT_GEAR - 2)) & _BTN_DECREMENT_GEAR) |
+                 ((raw & (1 << _PIN_INCREMENT_GEAR)) << (3 - _PIN_INCREMENT_GEAR)) |
+                 ((raw >> (_PIN_CONTROL - 4)) & _BTN_CONTROL))
+        prev = self._prev_mask
+        # Count how long the control button is held, one tick per scan
+        if not (prev & _BTN_CONTROL):
+            self._control_hold_ticks += 1
+        if state != self._pending_mask:
+            # Edge or bounce on any button - restart the quiet period
+            self._pending_mask = state
+            self._quiet_ticks = 0
+            return
+        quiet = self._quiet_ticks
+        if quiet < _DEBOUNCE_TICKS:
+            quiet += 1
+            self._quiet_ticks = quiet
+            if quiet < _DEBOUNCE_TICKS:
+                return
+        # State has settled - commit it
+        if state == prev:
+            if state == _BTN_ALL:
+                # All buttons released and stable - sleep until the next edge
+                self._scan_timer.deinit()
+                self._scanning = False
+            return
+        self._prev_mask = state
+        pressed = prev & ~state  # Was high, now low
+        if pressed & _BTN_CONTROL:
+            self._control_hold_ticks = 0
+        self._pressed_latch |= pressed
+        self._released_latch |= ~prev & state & _BTN_ALL  # Was low, now high
+
+    @micropython.native
     def _process_gear_clicks(self, current_time):
-        """Process accumulated gear clicks and apply gear changes after timeout.
+        """Apply accumulated gear clicks once the click deadline has passed.
 
         Counts rapid clicks and jumps directly to target gear after user stops clicking.
+        Only called while clicks are pending (_gear_delta != 0).
 
         Args:
             current_time: Current time in milliseconds.
         """
-        if self.gear_selector is None:
+        if _ticks_diff(current_time, self._gear_deadline) < 0:
             return
+        delta = self._gear_delta
 
-        # Process decrement clicks
-        if self.decrement_click_count > 0:
-            if self.decrement_start_gear is None:
-                # Shouldn't happen, but reset if it does
-                print(f"ERROR: decrement_click_count={self.decrement_click_count} but start_gear is None, resetting")
-                self.decrement_click_count = 0
-                return
+        start_gear = self._gear_start
+        # Reset click tracking
+        self._gear_delta = 0
+        self._gear_start = None
+
+        # Timeout expired - apply the clicks after the first (already
+        # applied) at once; nothing to do after a single click
+        if _DEBUG:
+            print("Gear clicks done:", start_gear, "clicks:", delta)
+        self._set_gear(start_gear + delta)
 
-            time_since_last = utime.ticks_diff(current_time, self.decrement_last_click_time)
-            if time_since_last >= self.gear_click_timeout_ms:
-                # Timeout expired - apply all gear changes at once
-                current_gear = self.gear_selector.current_gear
-                target_gear = max(1, self.decrement_start_gear - self.decrement_click_count)
-
-                print(f"Decrement timeout: start={self.decrement_start_gear}, clicks={self.decrement_click_count}, current={current_gear}, target={target_gear}")
-
-                # Jump directly to target gear
-                if target_gear != current_gear:
-                    self.gear_selector.current_gear = target_gear
-                    print(f"Gear jumped: {self.decrement_start_gear} -> {target_gear} ({self.decrement_click_count} clicks)")
-
-                    # Update display and load
-                    self._force_display_update()
-                    if self.load_controller is not None:
-                        self.load_controller.apply_load(force=True)
-                else:
-                    print(f"Gear already at target {target_gear}, no change needed")
-
-                # Reset click tracking
-                self.decrement_click_count = 0
-                self.decrement_start_gear = None
-
-        # Process increment clicks
-        if self.increment_click_count > 0 and self.increment_start_gear is not None:
-            time_since_last = utime.ticks_diff(current_time, self.increment_last_click_time)
-            if time_since_last >= self.gear_click_timeout_ms:
-                # Timeout expired - apply all gear changes at once
-                if self.gear_selector is not None:
-                    max_gear = self.gear_selector.num_gears
-                    target_gear = min(max_gear, self.increment_start_gear + self.increment_click_count)
-                    current_gear = self.gear_selector.current_gear
-
-                    # Jump directly to target gear
-                    if target_gear != current_gear:
-                        self.gear_selector.current_gear = target_gear
-                        print(f"Gear jumped: {self.increment_start_gear} -> {target_gear} ({self.increment_click_count} clicks)")
-
-                        # Update display and load
-                        self._force_display_update()
-                        if self.load_controller is not None:
-                            self.load_controller.apply_load(force=True)
-
-                # Reset click tracking
-                self.increment_click_count = 0
-                self.increment_start_gear = None
+    def _set_gear(self, target_gear):
+        """Jump to a gear (clamped to the valid range) and apply its load.
+
+        Args:
+            target_gear: Gear number to select.
+        """
+        gear_selector = self.gear_selector
+        target_gear = max(1, min(gear_selector.num_gears, target_gear))
+        if target_gear == gear_selector.current_gear:
+            return
+        gear_selector.current_gear = target_gear
+        if _DEBUG:
+            print("Gear set:", target_gear)
+
+        # Update display (speed depends on the gear ratio) and load
+        self._invalidate(DIRTY_SPEED | DIRTY_GEAR)
+        if self.load_controller is not None:
+            self.load_controller.apply_load(force=True)
 
     def _handle_timer_toggle(self, current_time):
         """Handle timer start/pause/resume toggle.
@@ -294,13 +456,17 @@ class ButtonController:
             # Resume timer
             self.timer_controller.start(current_time)
 
-        self._force_display_update()
+        self._invalidate(DIRTY_TIMER)
+
+    def _invalidate(self, regions):
+        """Mark display regions for redraw.
 
-    def _force_display_update(self):
-        """Force an immediate display update.
+        The view redraws them on its next flush_dirty() call from the main
+        loop, so several actions in one pass cost a single redraw.
 
-        Used when button actions require immediate visual feedback.
+        Args:
+            regions: Bitmask of Class_View DIRTY_* flags.
         """
         if self.view is not None:
-            self.view.render_all()
+            self.view.invalidate(regions)
 
@@ -1,4 +1,6 @@
-from machine import Pin
+from array import array
+from machine import Pin, disable_irq, enable_irq
+import micropython
 import utime
 
 
@@ -20,11 +22,16 @@ class CrankSensor:
         # Initialize pulse tracking
         self.pulse_count = 0
         self.last_pulse_time = 0
-        self.pulse_times = []  # Store recent pulse times for RPM calculation
-        self.crpm_pulse_times = []  # Store extended pulse times for CRPM calculation (10 second window)
-        self.sample_window_ms = 5000  # 5 second window for RPM calculation
         self.crpm_sample_window_ms = 10000  # 10 second window for CRPM calculation (allows low RPM detection)
-        self.max_pulse_times = 1000  # Maximum number of pulse times to store (memory protection)
+        self.max_pulse_times = 1000  # Ring buffer slots (one is kept free to mark full)
+
+        # Pulse times within the CRPM window, in a preallocated uint32 ring
+        # buffer so the interrupt handler never allocates. The handler only
+        # advances the head index and get_rpm() only advances the tail, so
+        # neither needs to disable interrupts. head == tail means empty.
+        self.pulse_times = array('I', bytes(4 * self.max_pulse_times))
+        self._pulse_head = 0
+        self._pulse_tail = 0
 
         self.hall_sensor = Pin(gpio_pin, Pin.IN, Pin.PULL_UP)
         # Note: GPIO reads pedal speed (cadence), not wheel speed
@@ -32,6 +39,7 @@ class CrankSensor:
         # Set up interrupt handler for pulse counting (trigger on rising edge)
         self.hall_sensor.irq(trigger=Pin.IRQ_RISING, handler=self._pulse_handler)
 
+    @micropython.native
     def _pulse_handler(self, _pin):
         """Interrupt handler for hall sensor pulses.
 
@@ -39,7 +47,7 @@ class CrankSensor:
         Sensor is normally LOW and goes HIGH when triggered.
 
         IMPORTANT: Keep this handler minimal - no memory allocation!
-        List cleanup is done in get_rpm() instead.
+        Expired pulse times are dropped in get_rpm() instead.
 
         Args:
             _pin: The pin that triggered the interrupt (unused but required by MicroPython).
@@ -48,13 +56,15 @@ class CrankSensor:
         self.pulse_count += 1
         self.last_pulse_time = current_time
         
-        # Only append if under limit - avoid memory allocation in interrupt
-        # List cleanup is done in get_rpm() to avoid GC in interrupt context
-        if len(self.pulse_times) < self.max_pulse_times:
-            self.pulse_times.append(current_time)
-        if len(self.crpm_pulse_times) < self.max_pulse_times:
-            self.crpm_pulse_times.append(current_time)
-
+        # Write the slot before publishing the new head, and drop the pulse
+        # if the buffer is full (get_rpm() has not trimmed it yet)
+        head = self._pulse_head
+        next_head = (head + 1) % self.max_pulse_times
+        if next_head != self._pulse_tail:
+            self.pulse_times[head] = current_time
+            self._pulse_head = next_head
+
+    @micropython.native
     def _calculate_crank_rpm(self):
         """Calculate current crank RPM from pulse data.
 
@@ -63,28 +73,29 @@ class CrankSensor:
         """
         current_time = utime.ticks_ms()
 
-        # Note: List cleanup is now done in get_rpm() to avoid allocations here
+        # Note: Expired pulse times are dropped in get_rpm() before this is called
+        size = self.max_pulse_times
+        pulse_times = self.pulse_times
+        head = self._pulse_head  # Snapshot - the interrupt handler may advance it
+        tail = self._pulse_tail
+        pulse_count = (head - tail) % size
 
-        if len(self.crpm_pulse_times) >= 2:
+        if pulse_count >= 2:
             # Multiple pulses: calculate RPM from time span
-            time_span = self.crpm_pulse_times[-1] - self.crpm_pulse_times[0]
+            time_span = utime.ticks_diff(pulse_times[(head - 1) % size], pulse_times[tail])
             if time_span > 0:
-                time_span_seconds = time_span / 1000.0
-                num_revolutions = len(self.crpm_pulse_times) - 1
-                pedal_rps = num_revolutions / time_span_seconds
-                return int(pedal_rps * 60)
-        elif len(self.crpm_pulse_times) == 1:
+                # Integer maths only - the RP2040 has no FPU (60000 ms per minute)
+                return ((pulse_count - 1) * 60000) // time_span
+        elif pulse_count == 1:
             # Single pulse: calculate RPM from time since that pulse
-            time_since_pulse = utime.ticks_diff(current_time, self.crpm_pulse_times[0])
+            time_since_pulse = utime.ticks_diff(current_time, pulse_times[tail])
             if time_since_pulse > 0 and time_since_pulse < 15000:  # Within 15 seconds
-                time_per_rev_seconds = time_since_pulse / 1000.0
-                return int(60.0 / time_per_rev_seconds)
+                return 60000 // time_since_pulse
         elif self.last_pulse_time > 0:
             # No recent pulses, but we have a last pulse time
             time_since_pulse = utime.ticks_diff(current_time, self.last_pulse_time)
             if time_since_pulse > 0 and time_since_pulse < 5000:  # Within 5 seconds
-                time_per_rev_seconds = time_since_pulse / 1000.0
-                return int(60.0 / time_per_rev_seconds)
+                return 60000 // time_since_pulse
 
         return 0
 
@@ -92,7 +103,7 @@ class CrankSensor:
         """Get current crank RPM.
 
         Processes pulses and returns the current crank RPM.
-        Also performs list cleanup that was deferred from interrupt handler.
+        Also drops expired pulse times, which the interrupt handler leaves behind.
 
         Returns:
             Crank RPM (revolutions per minute).
@@ -100,25 +111,42 @@ class CrankSensor:
         # Clean up old pulse times (older than sample window)
         # This is done here instead of interrupt handler to avoid GC during interrupts
         current_time = utime.ticks_ms()
-        cutoff_time = current_time - self.sample_window_ms
-        crpm_cutoff_time = current_time - self.crpm_sample_window_ms
-        
-        # Clean pulse_times list - filter in place to minimize allocations
-        i = 0
-        while i < len(self.pulse_times):
-            if self.pulse_times[i] <= cutoff_time:
-                self.pulse_times.pop(i)
-            else:
-                i += 1
-        
-        # Clean crpm_pulse_times list
-        i = 0
-        while i < len(self.crpm_pulse_times):
-            if self.crpm_pulse_times[i] <= crpm_cutoff_time:
-                self.crpm_pulse_times.pop(i)
-            else:
-                i += 1
+        # ticks_ms() wraps, so use ticks_add()/ticks_diff() - never raw arithmetic
+        self._trim_expired(utime.ticks_add(current_time, -self.crpm_sample_window_ms))
 
         # Calculate and return current crank RPM
         return self._calculate_crank_rpm()
 
+    @micropython.native
+    def _trim_expired(self, cutoff_time):
+        """Drop pulse times at or before cutoff_time from the ring buffer.
+
+        Pulse times are written in order, so expired entries always sit at
+        the tail - advance it past them without touching the buffer.
+
+        Args:
+            cutoff_time: Oldest time to discard (milliseconds).
+        """
+        pulse_times = self.pulse_times
+        size = self.max_pulse_times
+        head = self._pulse_head
+        tail = self._pulse_tail
+        while tail != head and utime.ticks_diff(pulse_times[tail], cutoff_time) <= 0:
+            tail = (tail + 1) % size
+        self._pulse_tail = tail
+
+    def get_revolution_data(self):
+        """Get the cumulative crank revolution count and last pulse time.
+
+        Both values are written by the interrupt handler, so they are read
+        together with interrupts disabled to get a consistent pair.
+
+        Returns:
+            Tuple of (pulse_count, last_pulse_time) where last_pulse_time
+            is in milliseconds from utime.ticks_ms().
+        """
+        irq_state = disable_irq()
+        pulse_count = self.pulse_count
+        last_pulse_time = self.last_pulse_time
+        enable_irq(irq_state)
+        return pulse_count, last_pulse_time
@@ -20,13 +20,12 @@ class GearSelector:
 
         # Calculate gear ratios (linearly distributed from min to max)
         # Gear 1 = min_ratio (easiest), Gear num_gears = max_ratio (hardest)
-        self.gear_ratios = {}
+        # Stored as a tuple indexed by gear_num - 1 (no dict hashing on lookup)
         if num_gears == 1:
-            self.gear_ratios[1] = min_ratio
+            self.gear_ratios = (min_ratio,)
         else:
             ratio_step = (max_ratio - min_ratio) / (num_gears - 1)
-            for gear_num in range(1, num_gears + 1):
-                self.gear_ratios[gear_num] = min_ratio + (ratio_step * (gear_num - 1))
+            self.gear_ratios = tuple(min_ratio + (ratio_step * i) for i in range(num_gears))
 
         # Calculate gear box dimensions and spacing
         self.gear_box_width = 25
@@ -62,7 +61,7 @@ class GearSelector:
         Returns:
             The gear ratio for the current gear.
         """
-        return self.gear_ratios.get(self.current_gear, self.min_ratio)
+        return self.gear_ratios[self.current_gear - 1]
 
     def get_gear_ratio(self, gear_num):
         """Get the gear ratio for a specific gear.
@@ -73,6 +72,8 @@ class GearSelector:
         Returns:
             The gear ratio for the specified gear, or min_ratio if invalid.
         """
-        return self.gear_ratios.get(gear_num, self.min_ratio)
+        if 1 <= gear_num <= self.num_gears:
+            return self.gear_ratios[gear_num - 1]
+        return self.min_ratio
 
 
@@ -1,5 +1,31 @@
 from machine import Pin, SPI
 import framebuf
+import micropython
+
+# ST7789 initialization sequence as <command, parameter count, parameters...>
+# records in one bytes constant
+_INIT_SEQUENCE = (
+    b'\x36\x01\x70'  # Memory data access control (orientation)
+    b'\x3a\x01\x05'  # Interface pixel format: 16-bit RGB565
+    b'\xb2\x05\x0c\x0c\x00\x33\x33'  # Porch setting
+    b'\xb7\x01\x35'  # Gate control
+    b'\xbb\x01\x19'  # VCOM setting
+    b'\xc0\x01\x2c'  # LCM control
+    b'\xc2\x01\x01'  # VDV and VRH command enable
+    b'\xc3\x01\x12'  # VRH set
+    b'\xc4\x01\x20'  # VDV set
+    b'\xc6\x01\x0f'  # Frame rate control in normal mode
+    b'\xd0\x02\xa4\xa1'  # Power control 1
+    b'\xe0\x0e\xd0\x04\x0d\x11\x13\x2b\x3f\x54\x4c\x18\x0d\x0b\x1f\x23'  # Positive gamma
+    b'\xe1\x0e\xd0\x04\x0c\x11\x13\x2c\x3f\x44\x51\x2f\x1f\x1f\x20\x23'  # Negative gamma
+    b'\x21\x00'  # Display inversion on
+    b'\x11\x00'  # Sleep out
+    b'\x29\x00'  # Display on
+)
+
+# Column/row address range covering the whole 240x240 panel (0x0000-0x00EF)
+_FULL_WINDOW = b'\x00\x00\x00\xef'
+
 
 class LCD1Inch3(framebuf.FrameBuffer):
     """Driver class for 1.3 inch LCD display with 240x240 resolution.
@@ -29,12 +55,20 @@ class LCD1Inch3(framebuf.FrameBuffer):
         self.rst = Pin(self.RST,Pin.OUT)
 
         self.cs(1)
-        self.spi = SPI(1)
-        self.spi = SPI(1,1000_000)
-        self.spi = SPI(1,100000_000,polarity=0, phase=0,sck=Pin(self.SCK),mosi=Pin(self.MOSI),miso=None)
+        # SPI clock is clk_peri / 2 at most (62.5 MHz at the default 125 MHz);
+        # the old 100 MHz request was silently rounded down to this anyway
+        self.spi = SPI(1,62_500_000,polarity=0, phase=0,sck=Pin(self.SCK),mosi=Pin(self.MOSI),miso=None)
         self.dc = Pin(self.DC,Pin.OUT)
         self.dc(1)
+        self._cmd1 = bytearray(1)  # Reused single byte for commands and write_cmd/write_data
+        # Reused 1-bit scratch buffer that write_text() renders 1x glyphs
+        # into, one byte per character per glyph row (grown as needed)
+        self._text_chars = 0
+        self._text_bits = None
+        self._text_fb = None
+        self._window = bytearray(4)  # Reused address window for show_region()
         self.buffer = bytearray(self.height * self.width * 2)
+        self.mv = memoryview(self.buffer)  # Zero-copy slices for show_region()
         super().__init__(self.buffer, self.width, self.height, framebuf.RGB565)
         self.init_display()
 
@@ -49,10 +83,11 @@ class LCD1Inch3(framebuf.FrameBuffer):
         Args:
             cmd: Command byte to send to the display.
         """
+        self._cmd1[0] = cmd
         self.cs(1)
         self.dc(0)
         self.cs(0)
-        self.spi.write(bytearray([cmd]))
+        self.spi.write(self._cmd1)
         self.cs(1)
 
     def write_data(self, buf):
@@ -61,12 +96,33 @@ class LCD1Inch3(framebuf.FrameBuffer):
         Args:
             buf: Data byte to send to the display.
         """
+        self._cmd1[0] = buf
         self.cs(1)
         self.dc(1)
         self.cs(0)
-        self.spi.write(bytearray([buf]))
+        self.spi.write(self._cmd1)
         self.cs(1)
 
+    def _send(self, cmd, data=None):
+        """Send a command byte and its parameter bytes.
+
+        Only DC is switched here - the caller holds CS low around a whole
+        group of commands so the display sees one continuous transfer.
+
+        Args:
+            cmd: Command byte to send to the display.
+            data: Parameter bytes for the command, or None if it takes none.
+        """
+        dc = self.dc
+        write = self.spi.write
+        cmd1 = self._cmd1
+        cmd1[0] = cmd
+        dc(0)
+        write(cmd1)
+        if data:
+            dc(1)
+            write(data)
+
     def init_display(self):
         """Initialize the display with required configuration commands.
 
@@ -77,67 +133,18 @@ class LCD1Inch3(framebuf.FrameBuffer):
         self.rst(1)
         self.rst(0)
         self.rst(1)
-        self.write_cmd(0x36)
-        self.write_data(0x70)
-        self.write_cmd(0x3A)
-        self.write_data(0x05)
-        self.write_cmd(0xB2)
-        self.write_data(0x0C)
-        self.write_data(0x0C)
-        self.write_data(0x00)
-        self.write_data(0x33)
-        self.write_data(0x33)
-        self.write_cmd(0xB7)
-        self.write_data(0x35)
-        self.write_cmd(0xBB)
-        self.write_data(0x19)
-        self.write_cmd(0xC0)
-        self.write_data(0x2C)
-        self.write_cmd(0xC2)
-        self.write_data(0x01)
-        self.write_cmd(0xC3)
-        self.write_data(0x12)
-        self.write_cmd(0xC4)
-        self.write_data(0x20)
-        self.write_cmd(0xC6)
-        self.write_data(0x0F)
-        self.write_cmd(0xD0)
-        self.write_data(0xA4)
-        self.write_data(0xA1)
-        self.write_cmd(0xE0)
-        self.write_data(0xD0)
-        self.write_data(0x04)
-        self.write_data(0x0D)
-        self.write_data(0x11)
-        self.write_data(0x13)
-        self.write_data(0x2B)
-        self.write_data(0x3F)
-        self.write_data(0x54)
-        self.write_data(0x4C)
-        self.write_data(0x18)
-        self.write_data(0x0D)
-        self.write_data(0x0B)
-        self.write_data(0x1F)
-        self.write_data(0x23)
-        self.write_cmd(0xE1)
-        self.write_data(0xD0)
-        self.write_data(0x04)
-        self.write_data(0x0C)
-        self.write_data(0x11)
-        self.write_data(0x13)
-        self.write_data(0x2C)
-        self.write_data(0x3F)
-        self.write_data(0x44)
-        self.write_data(0x51)
-        self.write_data(0x2F)
-        self.write_data(0x1F)
-        self.write_data(0x1F)
-        self.write_data(0x20)
-        self.write_data(0x23)
-        self.write_cmd(0x21)
-        self.write_cmd(0x11)
-        self.write_cmd(0x29)
+        send = self._send
+        init = memoryview(_INIT_SEQUENCE)  # Slices below are not copied
+        end = len(init)
+        i = 0
+        self.cs(0)
+        while i < end:
+            count = init[i + 1]
+            send(init[i], init[i + 2:i + 2 + count])
+            i += 2 + count
+        self.cs(1)
 
+    @micropython.native
     def show(self):
         """Update the display with the current frame buffer contents.
 
@@ -145,24 +152,68 @@ class LCD1Inch3(framebuf.FrameBuffer):
         updating the visible screen with any drawing operations
         that have been performed.
         """
-        self.write_cmd(0x2A)
-        self.write_data(0x00)
-        self.write_data(0x00)
-        self.write_data(0x00)
-        self.write_data(0xef)
-        self.write_cmd(0x2B)
-        self.write_data(0x00)
-        self.write_data(0x00)
-        self.write_data(0x00)
-        self.write_data(0xEF)
-        self.write_cmd(0x2C)
-        self.cs(1)
-        self.dc(1)
-        self.cs(0)
-        self.spi.write(self.buffer)
-        self.cs(1)
+        # Constant window bytes and the reused command byte in _send()
+        # mean nothing is allocated per frame. CS stays low for the whole
+        # window setup and pixel transfer.
+        cs = self.cs
+        send = self._send
+        cs(0)
+        send(0x2A, _FULL_WINDOW)  # Column address set
+        send(0x2B, _FULL_WINDOW)  # Row address set
+        send(0x2C, self.buffer)  # Memory write
+        cs(1)
+
+    @micropython.native
+    def show_region(self, x0, y0, x1, y1):
+        """Update only a rectangle of the display from the frame buffer.
+
+        Full-width regions are sent as one contiguous slice of the frame
+        buffer; narrower regions are sent one row slice at a time. Slices
+        of the memoryview are not copied.
+
+        Args:
+            x0: Left column (inclusive).
+            y0: Top row (inclusive).
+            x1: Right column (inclusive).
+            y1: Bottom row (inclusive).
+        """
+        x0 = max(x0, 0)
+        y0 = max(y0, 0)
+        x1 = min(x1, self.width - 1)
+        y1 = min(y1, self.height - 1)
+        if x1 < x0 or y1 < y0:
+            return
+        cs = self.cs
+        send = self._send
+        window = self._window
+        mv = self.mv
+        row_bytes = self.width * 2
+
+        cs(0)
+        window[0] = 0
+        window[1] = x0
+        window[2] = 0
+        window[3] = x1
+        send(0x2A, window)  # Column address set
+        window[1] = y0
+        window[3] = y1
+        send(0x2B, window)  # Row address set
+        if x0 == 0 and x1 == self.width - 1:
+            send(0x2C, mv[y0 * row_bytes:(y1 + 1) * row_bytes])  # Memory write
+        else:
+            send(0x2C)  # Memory write, rows follow as data
+            self.dc(1)
+            write = self.spi.write
+            start = y0 * row_bytes + x0 * 2
+            end = start + (x1 - x0 + 1) * 2
+            for _ in range(y1 - y0 + 1):
+                write(mv[start:end])
+                start += row_bytes
+                end += row_bytes
+        cs(1)
 
     # def taken from https://github.com/dhargopala/pico-custom-font/blob/main/lcd_lib.py
+    @micropython.native
     def write_text(self,text,x,y,size,color):
         """Write text on OLED/LCD display with variable font size.
 
@@ -186,33 +237,32 @@ class LCD1Inch3(framebuf.FrameBuffer):
         else:
             color = int(color)
         
-        # Get background color, default to black if None
-        try:
-            background = self.pixel(x, y)
-            if background is None:
-                background = 0x0000  # Black
-            else:
-                background = int(background)
-        except:
-            background = 0x0000  # Black
-        
-        info = []
-
-        # Creating reference charaters to read their values
-        self.text(text,x,y,color)
-        for i in range(x,x+(8*len(text))):
-            for j in range(y,y+8):
-                # Fetching amd saving details of pixels, such as
-                # x co-ordinate, y co-ordinate, and color of the pixel
-                px_color = self.pixel(i,j)
-                if px_color == color:
-                    info.append((i, j, px_color))
-
-        # Clearing the reference characters from the screen
-        self.text(text,x,y,background)
+        # Draw the reference characters at 1x into the scratch buffer, then
+        # draw each set glyph pixel on screen as a size x size block. The
+        # frame buffer itself is never read back or drawn twice.
+        chars = len(text)
+        if chars > self._text_chars:
+            self._text_chars = chars
+            self._text_bits = bytearray(chars * 8)
+            self._text_fb = framebuf.FrameBuffer(self._text_bits, chars * 8, 8, framebuf.MONO_HLSB)
+        stride = self._text_chars
+        bits = self._text_bits
+        text_fb = self._text_fb
+        text_fb.fill(0)
+        text_fb.text(text, 0, 0, 1)
 
         # Writing the custom-sized font characters on screen
-        for px_info in info:
-            self.fill_rect(size*px_info[0] - (size-1)*x , size*px_info[1] - (size-1)*y, size, size, px_info[2])
+        fill_rect = self.fill_rect
+        for row in range(8):
+            py = y + size * row
+            offset = row * stride
+            for char in range(chars):
+                glyph_row = bits[offset + char]
+                if not glyph_row:
+                    continue
+                px = x + size * 8 * char
+                for col in range(8):
+                    if glyph_row & (0x80 >> col):
+                        fill_rect(px + size * col, py, size, size, color)
 
 # ========= End of Driver ===========
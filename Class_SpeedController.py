@@ -37,6 +37,26 @@ class SpeedController:
             return self.crank_sensor.get_rpm()
         return 0
 
+    def get_crank_revolution_data(self):
+        """Get cumulative crank revolutions and last crank event time.
+
+        Returns:
+            Tuple of (revolutions, last_event_time_ms), or (0, 0) if sensor not available.
+        """
+        if self.crank_sensor is not None:
+            return self.crank_sensor.get_revolution_data()
+        return 0, 0
+
+    def get_wheel_revolution_data(self):
+        """Get cumulative wheel revolutions and last wheel event time.
+
+        Returns:
+            Tuple of (revolutions, last_event_time_ms), or (0, 0) if sensor not available.
+        """
+        if self.wheel_speed_sensor is not None:
+            return self.wheel_speed_sensor.get_revolution_data()
+        return 0, 0
+
     def get_wheel_rpm(self):
         """Get current wheel RPM.
 
@@ -10,6 +10,19 @@ COLOR_YELLOW = 0xFFE0
 COLOR_ORANGE = 0xFDA0  # Yellow-orange
 COLOR_GRAY = 0xC618  # Medium gray (200,200,200)
 
+# Display regions for View.invalidate() / View.flush_dirty()
+DIRTY_SPEED = 0x01  # Speed, incline (top of screen)
+DIRTY_TIMER = 0x02  # Timer row
+DIRTY_GEAR = 0x04   # Gear selector (bottom of screen)
+DIRTY_ALL = 0x07
+
+# Screen layout (rows), shared by the _render_* methods and flush_dirty()
+_SPEED_AREA_HEIGHT = 205  # Speed/incline area: rows 0 to 204, cleared on each redraw
+_GEAR_FROM_BOTTOM = 20    # Gear boxes start this many rows above the screen bottom
+_GEAR_STRIP_MARGIN = 2    # Gear strip clear extends this far above/below the boxes
+_TIMER_HEIGHT = 16        # Timer text (size 2 = 16 pixels tall)
+_TIMER_GAP = 6            # Gap between the timer row and the gear boxes
+
 
 class View:
     """View class for managing all display logic and rendering.
@@ -50,12 +63,42 @@ class View:
         self.screen_width = int(screen_width)
         self.screen_height = int(screen_height)
 
+        # Regions waiting to be redrawn by flush_dirty() (DIRTY_* bitmask)
+        self._dirty = 0
+
+        # Rows of each display region (from the _SPEED/_GEAR/_TIMER layout)
+        self._gear_y = self.screen_height - _GEAR_FROM_BOTTOM
+        self._gear_strip_top = self._gear_y - _GEAR_STRIP_MARGIN
+        self._timer_y = self._gear_y - _TIMER_HEIGHT - _TIMER_GAP
+
+        # Gear selector layout is fixed - compute box positions, labels and
+        # centered label positions once instead of on every render
+        self._gear_x = ()
+        self._gear_strs = ()
+        self._gear_text_x = ()
+        if gear_selector is not None:
+            box_width = gear_selector.gear_box_width
+            box_pitch = box_width + gear_selector.gear_spacing
+            start_x = (self.screen_width - gear_selector.total_width) // 2
+            self._gear_x = tuple(start_x + i * box_pitch for i in range(gear_selector.num_gears))
+            self._gear_strs = tuple(str(i + 1) for i in range(gear_selector.num_gears))
+            # Center the text in the box (size 2 = 8*2 = 16 pixels per character)
+            self._gear_text_x = tuple(x + (box_width - 16 * len(gear_str)) // 2
+                                      for x, gear_str in zip(self._gear_x, self._gear_strs))
+        # Gear currently shown in the strip (None = strip must be fully redrawn)
+        self._last_drawn_gear = None
+        # Frame buffer rows of the strip with no gear selected, captured on
+        # the first render and copied back in on later ones
+        self._gear_strip = None
+
     def render_all(self):
         """Render all display elements.
 
         This is the main method to update the entire display.
         Errors are caught and logged to prevent display failures from crashing the system.
         """
+        self._dirty = 0  # Everything is redrawn
+        self._last_drawn_gear = None  # Screen is cleared or replaced below
         try:
             # Check if in pairing mode - if so, only show pairing status
             if self.ble_controller is not None and self.ble_controller.is_pairing_mode():
@@ -109,6 +152,56 @@ class View:
             except:
                 pass
 
+    def invalidate(self, regions):
+        """Mark display regions as needing a redraw.
+
+        Cheap enough to call from input handlers - nothing is drawn until
+        flush_dirty().
+
+        Args:
+            regions: Bitmask of DIRTY_* flags.
+        """
+        self._dirty |= regions
+
+    def flush_dirty(self):
+        """Redraw only the regions marked by invalidate(), then show them.
+
+        Only the band of rows that was redrawn is sent to the display.
+        Does nothing if no region is dirty. Falls back to render_all() when
+        everything is dirty or the pairing screen is showing.
+        """
+        dirty = self._dirty
+        if not dirty:
+            return
+        if dirty == DIRTY_ALL or (self.ble_controller is not None and
+                                  self.ble_controller.is_pairing_mode()):
+            self.render_all()
+            return
+        self._dirty = 0
+
+        # Band of rows touched by the redraws below
+        top = self.screen_height
+        bottom = -1
+        try:
+            if dirty & DIRTY_SPEED and self.speed_controller is not None:
+                self._render_speed()
+                # The speed area clear overlaps the top of the timer row
+                dirty |= DIRTY_TIMER
+                top = 0
+                bottom = _SPEED_AREA_HEIGHT - 1
+            if dirty & DIRTY_TIMER and self.timer_controller is not None:
+                self._render_timer(clear=True)
+                top = min(top, self._timer_y)
+                bottom = max(bottom, self._timer_y + _TIMER_HEIGHT - 1)
+            if dirty & DIRTY_GEAR and self.gear_selector is not None:
+                if self._update_gear_selector():
+                    top = min(top, self._gear_strip_top)
+                    bottom = self.screen_height - 1
+            if bottom >= top:
+                self.lcd.show_region(0, top, self.screen_width - 1, bottom)
+        except Exception as e:
+            print(f"Error in flush_dirty: {e}")
+
     def _render_speed(self):
         """Render speed information (calculated speed from wheel * gear ratio, RPM, load, incline)."""
         if self.speed_controller is None:
@@ -126,8 +219,7 @@ class View:
         unit_label = "mph"
 
         # Clear display area
-        display_height = 205
-        self.lcd.fill_rect(0, 0, self.screen_width, display_height, self.back_col)
+        self.lcd.fill_rect(0, 0, self.screen_width, _SPEED_AREA_HEIGHT, self.back_col)
 
         # Display speed label
         label_y = 0
@@ -211,8 +303,12 @@ class View:
             print(f"Error rendering RPM/load section: {e}")
             # Continue rendering other elements
 
-    def _render_timer(self):
-        """Render timer display."""
+    def _render_timer(self, clear=False):
+        """Render timer display.
+
+        Args:
+            clear: Clear the timer row first (when not redrawing the whole screen).
+        """
         if self.timer_controller is None:
             return
 
@@ -235,13 +331,8 @@ class View:
             label_char_width = char_width_base * timer_label_size
             value_char_width = char_width_base * timer_value_size
 
-            # Position timer just above gear display
-            # Gear display is at bottom (screen_height - 20)
-            # Timer should be above it with a small gap
-            gear_display_y = self.screen_height - 20  # Same calculation as gear selector
-            timer_text_height = timer_value_size * 8  # Size 2 = 16 pixels tall
-            gap = 6  # Gap between timer and gear display
-            timer_y = gear_display_y - timer_text_height - gap
+            # Position timer just above gear display, with a small gap
+            timer_y = self._timer_y
 
             # Calculate total width needed
             label_width = len(timer_label) * label_char_width
@@ -256,6 +347,9 @@ class View:
             timer_value_x = label_x + label_width + 4  # Small gap after label
             timer_value_y = label_y
 
+            if clear:
+                self.lcd.fill_rect(0, timer_y, self.screen_width, _TIMER_HEIGHT, self.back_col)
+
             # Display label
             self.lcd.write_text(timer_label, label_x, label_y, timer_label_size, COLOR_GRAY)
             # Display timer value
@@ -355,38 +449,72 @@ class View:
             return
 
         # Calculate display position (bottom of screen)
-        display_y = self.screen_height - 20
-        # Calculate starting x position to center the gear display
-        start_x = (self.screen_width - self.gear_selector.total_width) // 2
-
-        # Clear the gear display area
-        self.lcd.fill_rect(0, display_y - 2,
-                          self.screen_width, self.gear_selector.gear_box_height + 4, self.back_col)
-
-        # Display each gear
-        for gear_num in range(1, self.gear_selector.num_gears + 1):
-            x_pos = start_x + ((gear_num - 1) *
-                              (self.gear_selector.gear_box_width + self.gear_selector.gear_spacing))
-
-            if gear_num == self.gear_selector.current_gear:
-                # Selected gear: white box with inverted text (black text)
-                # Draw white box
-                self.lcd.fill_rect(x_pos, display_y,
-                                  self.gear_selector.gear_box_width, self.gear_selector.gear_box_height,
-                                  COLOR_WHITE)
-                # Draw gear number in black (inverted)
-                gear_str = str(gear_num)
-                # Center the text in the box (size 2 = 8*2 = 16 pixels per character)
-                text_width = 16 * len(gear_str)
-                text_x = x_pos + (self.gear_selector.gear_box_width - text_width) // 2
-                self.lcd.write_text(gear_str, text_x, display_y + 6, 2, COLOR_BLACK)
-            else:
-                # Unselected gear: normal text on background
-                gear_str = str(gear_num)
-                # Center the text in the box (size 2 = 8*2 = 16 pixels per character)
-                text_width = 16 * len(gear_str)
-                text_x = x_pos + (self.gear_selector.gear_box_width - text_width) // 2
-                self.lcd.write_text(gear_str, text_x, display_y + 6, 2, COLOR_WHITE)
+        display_y = self._gear_y
+        box_width = self.gear_selector.gear_box_width
+        box_height = self.gear_selector.gear_box_height
+        current_index = self.gear_selector.current_gear - 1
+        gear_x = self._gear_x
+        gear_strs = self._gear_strs
+        gear_text_x = self._gear_text_x
+
+        # The strip with every gear unselected never changes: draw it once,
+        # keep a copy of its frame buffer rows and copy those back in later
+        row_bytes = self.screen_width * 2
+        strip_top = self._gear_strip_top
+        strip_height = box_height + 2 * _GEAR_STRIP_MARGIN
+        strip_start = strip_top * row_bytes
+        strip_end = min(strip_top + strip_height, self.screen_height) * row_bytes
+        if self._gear_strip is not None:
+            self.lcd.mv[strip_start:strip_end] = self._gear_strip
+        else:
+            # Clear the gear display area
+            self.lcd.fill_rect(0, strip_top, self.screen_width, strip_height, self.back_col)
+            # Unselected gears: normal text on background
+            for i in range(len(gear_x)):
+                self.lcd.write_text(gear_strs[i], gear_text_x[i], display_y + 6, 2, COLOR_WHITE)
+            self._gear_strip = bytes(self.lcd.mv[strip_start:strip_end])
+
+        # Selected gear: clear its cell, then white box with inverted text
+        self.lcd.fill_rect(gear_x[current_index] - 1, strip_top,
+                          box_width + 2, strip_height, self.back_col)
+        self.lcd.fill_rect(gear_x[current_index], display_y, box_width, box_height, COLOR_WHITE)
+        self.lcd.write_text(gear_strs[current_index], gear_text_x[current_index],
+                            display_y + 6, 2, COLOR_BLACK)
+        self._last_drawn_gear = current_index + 1
+
+    def _update_gear_selector(self):
+        """Redraw only the gear cells that changed since the last render.
+
+        Falls back to a full _render_gear_selector() if the strip has not
+        been drawn since the screen was last cleared.
+
+        Returns:
+            True if anything was drawn, False if the strip was up to date.
+        """
+        current_gear = self.gear_selector.current_gear
+        last_gear = self._last_drawn_gear
+        if last_gear == current_gear:
+            return False
+        if last_gear is None:
+            self._render_gear_selector()
+            return True
+
+        display_y = self._gear_y
+        box_width = self.gear_selector.gear_box_width
+        box_height = self.gear_selector.gear_box_height
+
+        # Previously selected gear: clear its box, draw plain text
+        i = last_gear - 1
+        self.lcd.fill_rect(self._gear_x[i] - 1, self._gear_strip_top,
+                          box_width + 2, box_height + 2 * _GEAR_STRIP_MARGIN, self.back_col)
+        self.lcd.write_text(self._gear_strs[i], self._gear_text_x[i], display_y + 6, 2, COLOR_WHITE)
+
+        # Newly selected gear: white box with inverted text
+        i = current_gear - 1
+        self.lcd.fill_rect(self._gear_x[i], display_y, box_width, box_height, COLOR_WHITE)
+        self.lcd.write_text(self._gear_strs[i], self._gear_text_x[i], display_y + 6, 2, COLOR_BLACK)
+        self._last_drawn_gear = current_gear
+        return True
 
     def display_calibration_status(self, status_text, detail_text=None):
         """Display calibration status on the screen.
@@ -1,4 +1,4 @@
-from machine import Pin
+from machine import Pin, disable_irq, enable_irq
 import utime
 
 
@@ -107,3 +107,18 @@ class WheelSpeedSensor:
         # Calculate and return current wheel RPM
         return self._calculate_wheel_rpm(current_time)
 
+    def get_revolution_data(self):
+        """Get the cumulative wheel revolution count and last pulse time.
+
+        Both values are written by the interrupt handler, so they are read
+        together with interrupts disabled to get a consistent pair.
+
+        Returns:
+            Tuple of (pulse_count, last_pulse_time) where last_pulse_time
+            is in milliseconds from utime.ticks_ms().
+        """
+        irq_state = disable_irq()
+        pulse_count = self.pulse_count
+        last_pulse_time = self.last_pulse_time
+        enable_irq(irq_state)
+        return pulse_count, last_pulse_time
@@ -55,7 +55,6 @@ CALIBRATION_DELAY_SEC = 3  # Wait before starting calibration
 
 # BLE configuration
 BLE_ENABLED = True  # Set to False to disable BLE (requires Pico W)
-BLE_UPDATE_INTERVAL_MS = 1000  # Update BLE data every second
 
 # Error handling configuration
 ERROR_RETRY_DELAY_MS = 1000  # Delay after error before retry
@@ -135,7 +134,7 @@ try:
                 load_controller=load_controller
             )
             ble_controller.set_wheel_circumference(int(WHEEL_CIRCUMFERENCE_M * 1000))  # Convert to mm
-            print("BLE controller initialized")
+            print(f"BLE controller initialized as '{ble_controller.name}'")
         except Exception as e:
             print(f"Warning: Failed to initialize BLE: {e}")
             print("Continuing without BLE support...")
@@ -193,7 +192,6 @@ except Exception as e:
 
 # =========== Main Loop ===========
 last_display_update_time = utime.ticks_ms()
-last_ble_update_time = utime.ticks_ms()
 consecutive_errors = 0
 
 while True:
@@ -202,18 +200,14 @@ while True:
 
         # Check all buttons and handle actions
         button_controller.check_buttons()
+        # Redraw only what button actions changed (no-op if nothing did)
+        view.flush_dirty()
 
         # Continuously update load to adjust motor position towards target
         load_controller.apply_load()
 
-        # Update BLE data if enabled
-        if ble_controller is not None:
-            # Update pairing mode (check for timeout)
-            ble_controller.update_pairing_mode(current_time)
-
-            if utime.ticks_diff(current_time, last_ble_update_time) >= BLE_UPDATE_INTERVAL_MS:
-                ble_controller.update()  # Broadcast FTMS + CSC data
-                last_ble_update_time = current_time
+        # BLE notifications and pairing mode timeout are timer driven
+        # inside BLEController - nothing to poll here
 
         # Update display at configured interval
         if utime.ticks_diff(current_time, last_display_update_time) >= DISPLAY_UPDATE_INTERVAL_MS:
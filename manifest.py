@@ -0,0 +1,25 @@
+# Frozen module manifest for building custom Pico W firmware.
+#
+# Freezing compiles modules to bytecode at build time and stores them in
+# flash, so they are not parsed or allocated on the heap at import time.
+#
+# Build (from the MicroPython ports/rp2 directory):
+#   make BOARD=RPI_PICO_W FROZEN_MANIFEST=/path/to/pico-bike-trainer/manifest.py
+#
+# To check a module is running frozen, remove its .py from the filesystem,
+# import it, and confirm `Class_BLEController.__file__` starts with ".frozen".
+# micropython.mem_info() should show less heap in use than with the .py.
+
+include("$(BOARD_DIR)/manifest.py")
+
+# BLE controller (largest module - FTMS/CSC tables and handlers)
+module("Class_BLEController.py", opt=3)
+
+# Button controller (scanned every 6 ms - keeps its bytecode out of the heap)
+module("Class_ButtonController.py", opt=3)
+
+# LCD driver (init table, show() and write_text() run on every redraw)
+module("Class_LCD1Inch3.py", opt=3)
+
+# Gear selector (gear ratio lookups from the speed and load paths)
+module("Class_GearSelector.py", opt=3)
@@ -53,6 +53,10 @@ try:
             return 80  # Simulate 80 RPM
         def get_calculated_speed(self):
             return 25.0  # Simulate 25 km/h
+        def get_wheel_revolution_data(self):
+            return 100, 0  # Simulate 100 wheel revolutions
+        def get_crank_revolution_data(self):
+            return 50, 0  # Simulate 50 crank revolutions
 
     class MockLoadController:
         def get_incline(self):